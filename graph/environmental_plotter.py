@@ -12,17 +12,45 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QGridLayout, QLabel, QLineEdit, 
                              QPushButton, QComboBox, QProgressBar, QMessageBox,
                              QFileDialog, QGroupBox, QStatusBar, QHBoxLayout, QButtonGroup)
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
+import hashlib
 import os
+import shutil
+
+try:
+    import pyarrow  # noqa: F401 - Parquet engine for the on-disk parse cache
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 # Import from new modules
-from ftp_manager import FTPDownloadThread
+from ftp_manager import FTPDataManager, FTPDownloadThread, parse_csv_bytes
 from plot_canvas import MatplotlibCanvas
 
+DATE_FORMAT = "%d/%m/%Y"
+
+# Parsed CSVs are kept as Parquet keyed by content hash so restarts skip re-parsing.
+# PLOTTER_PARSE_CACHE=0 disables it, PLOTTER_PARSE_CACHE=clear empties it on startup
+PARSE_CACHE_MODE = os.environ.get('PLOTTER_PARSE_CACHE', '1').lower()
+PARSE_CACHE_ENABLED = HAS_PYARROW and PARSE_CACHE_MODE != '0'
+PARSE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'bme280', 'parsed')
+# Part of every cache file name; bump it when parse_csv_bytes' output changes so
+# frames parsed by an older parser are never loaded (they are pruned instead)
+PARSE_CACHE_VERSION = 2
+# Least recently used parsed files beyond this count are deleted
+PARSE_CACHE_MAX_FILES = 1000
+
+# Cached "is DEBUG enabled" check for hot paths whose log arguments are costly; set by setup_logging()
+_DEBUG = False
+
 # Configure logging
 def setup_logging():
     """Setup comprehensive logging for the application"""
+    global _DEBUG
     
     # Create formatter
     formatter = logging.Formatter(
@@ -31,13 +59,14 @@ def setup_logging():
     
     # Console handler only
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.DEBUG)
     console_handler.setFormatter(formatter)
     
-    # Root logger
+    # Root logger - INFO by default, PLOTTER_LOG_LEVEL=DEBUG for troubleshooting
+    level_name = os.environ.get('PLOTTER_LOG_LEVEL', 'INFO').upper()
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
+    root_logger.setLevel(getattr(logging, level_name, logging.INFO))
     root_logger.addHandler(console_handler)
+    _DEBUG = root_logger.isEnabledFor(logging.DEBUG)
     
     # Create application logger
     logger = logging.getLogger('EnvironmentalPlotter')
@@ -46,10 +75,45 @@ def setup_logging():
     
     return logger
 
+
+@lru_cache(maxsize=1024)
+def parse_date(date_str: str) -> datetime:
+    """Parse a DD/MM/YYYY combo box date, memoized across plot/export clicks"""
+    return datetime.strptime(date_str, DATE_FORMAT)
+
+
+def dates_in_range(start_dt: datetime, end_dt: datetime) -> list:
+    """Return every day from start to end (inclusive) as DD/MM/YYYY strings"""
+    return pd.date_range(start_dt, end_dt, freq='D').strftime(DATE_FORMAT).tolist()
+
 # Initialize logging
 logger = setup_logging()
 
 
+class DataWorkerSignals(QObject):
+    """Signals for DataWorker (QRunnable itself cannot emit)"""
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str, str)
+
+
+class DataWorker(QRunnable):
+    """Run a data-processing function on the global thread pool and report back via signals"""
+    
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = DataWorkerSignals()
+    
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.error.emit(str(e), traceback.format_exc())
+        else:
+            self.signals.finished.emit(result)
+
+
 class EnvironmentalDataPlotter(QMainWindow):
     """Main application class"""
     
@@ -64,7 +128,15 @@ class EnvironmentalDataPlotter(QMainWindow):
         
         self.data_cache = {}  # Cache downloaded indoor data
         self.outdoor_data_cache = {}  # Cache downloaded outdoor data
+        self._parsed_cache = {}  # Parsed DataFrames keyed by (date_str, 'indoor'|'outdoor')
         self.available_dates = []
+        self.ftp_manager = FTPDataManager()  # Listing session kept open between downloads
+        self._worker = None  # Running DataWorker, if any; plot/export are disabled meanwhile
+        self._pending_download = None  # Download result held back until the running worker is done
+        self._replot_pending = False
+        self._parse_cache_stores = 0  # Disk cache writes this session, to pace pruning
+        if PARSE_CACHE_ENABLED and PARSE_CACHE_MODE == 'clear':
+            self.clear_parse_cache()
         
         self.logger.debug("Setting up user interface")
         self.setup_ui()
@@ -297,7 +369,8 @@ class EnvironmentalDataPlotter(QMainWindow):
                 server,
                 username,
                 self.password_edit.text(),
-                directory
+                directory,
+                ftp_manager=self.ftp_manager
             )
             
             # Connect signals
@@ -316,14 +389,31 @@ class EnvironmentalDataPlotter(QMainWindow):
             self.connect_btn.setEnabled(True)
             QMessageBox.critical(self, "Error", f"Failed to start download: {str(e)}")
     
+    def closeEvent(self, event):
+        """Close the persistent FTP session on exit"""
+        self.ftp_manager.disconnect()
+        super().closeEvent(event)
+    
     def on_download_complete(self, data_cache, outdoor_data_cache, available_dates):
         """Handle successful download completion"""
         self.logger.info(f"Download completed successfully - {len(available_dates)} files downloaded")
         self.logger.debug(f"Available dates: {available_dates}")
         
+        if self._worker is not None:
+            # The worker reads the raw caches and fills the parsed/plot caches;
+            # swapping them now would let it store stale results in the new ones
+            self.logger.debug("Data processing in progress, applying download when it finishes")
+            self._pending_download = (data_cache, outdoor_data_cache, available_dates)
+            return
+        self._apply_download(data_cache, outdoor_data_cache, available_dates)
+    
+    def _apply_download(self, data_cache, outdoor_data_cache, available_dates):
+        """Replace the cached data with a finished download and refresh the UI"""
         try:
             self.data_cache = data_cache
             self.outdoor_data_cache = outdoor_data_cache
+            self._parsed_cache.clear()
+            self.canvas.clear_plot_cache()
             self.available_dates = available_dates
             
             self.logger.debug("Updating date selection dropdowns")
@@ -335,7 +425,9 @@ class EnvironmentalDataPlotter(QMainWindow):
             total_files = indoor_count + outdoor_count
             
             self.logger.info("Download process completed and UI updated")
-            QMessageBox.information(self, "Success", f"Downloaded {total_files} data files ({indoor_count} indoor, {outdoor_count} outdoor)")
+            # Self-dismissing status message rather than a modal dialog; errors still use QMessageBox
+            self.status_bar.showMessage(
+                f"Downloaded {total_files} data files ({indoor_count} indoor, {outdoor_count} outdoor)", 5000)
         except Exception as e:
             self.logger.error(f"Error handling download completion: {e}")
             self.logger.debug(f"Full traceback: {traceback.format_exc()}")
@@ -365,102 +457,227 @@ class EnvironmentalDataPlotter(QMainWindow):
             # Update info label
             start_date = self.available_dates[0]
             end_date = self.available_dates[-1]
-            self.logger.debug(f"Date range: {start_date} to {end_date} ({len(self.available_dates)} days)")
-            self.dates_info_label.setText(f"{start_date} to {end_date} ({len(self.available_dates)} days)")
+            range_text = f"{start_date} to {end_date} ({len(self.available_dates)} days)"
+            self.logger.debug("Date range: %s", range_text)
+            self.dates_info_label.setText(range_text)
             
-            # Update dropdowns
+            # Update dropdowns without a change signal per inserted item
             self.logger.debug("Populating date dropdowns")
-            self.start_date_combo.clear()
-            self.end_date_combo.clear()
-            self.start_date_combo.addItems(self.available_dates)
-            self.end_date_combo.addItems(self.available_dates)
+            for combo in (self.start_date_combo, self.end_date_combo):
+                combo.blockSignals(True)
+                combo.clear()
+                combo.addItems(self.available_dates)
+                combo.blockSignals(False)
             
             # Set default selection
             self.start_date_combo.setCurrentText(start_date)
             self.end_date_combo.setCurrentText(end_date)
             
-            # Enable buttons
-            self.plot_btn.setEnabled(True)
-            self.export_btn.setEnabled(True)
+            # Enable buttons (a running plot/export re-enables them when it finishes)
+            if self._worker is None:
+                self.plot_btn.setEnabled(True)
+                self.export_btn.setEnabled(True)
             
             self.logger.info("Date selection updated successfully")
         except Exception as e:
             self.logger.error(f"Error updating date selection: {e}")
             self.logger.debug(f"Full traceback: {traceback.format_exc()}")
     
-    def parse_csv_content(self, content: str) -> pd.DataFrame:
-        """Parse CSV content into pandas DataFrame"""
-        self.logger.debug(f"Parsing CSV content ({len(content)} characters)")
+    def parse_csv_content(self, content) -> pd.DataFrame:
+        """Parse CSV content (raw bytes as downloaded, or str) into pandas DataFrame"""
+        self.logger.debug("Parsing CSV content (%d bytes)", len(content))
+        
+        if not content or content.isspace():
+            self.logger.warning("No data lines found in CSV content")
+            return pd.DataFrame()
+        
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        cache_path = self._parse_cache_path(content)
+        df = self._load_cached_parse(cache_path)
+        if df is not None:
+            return df
         
         try:
-            lines = content.strip().split('\n')
-            self.logger.debug(f"CSV has {len(lines)} lines")
-            
-            # Skip header if present
-            data_lines = []
-            for line in lines:
-                if line.strip() and not line.startswith('Date,Sample'):
-                    data_lines.append(line.strip())
-            
-            self.logger.debug(f"Found {len(data_lines)} data lines after filtering")
+            df = parse_csv_bytes(content)
             
-            if not data_lines:
-                self.logger.warning("No data lines found in CSV content")
-                return pd.DataFrame()
-            
-            # Parse data
-            parsed_data = []
-            for i, line in enumerate(data_lines):
-                try:
-                    parts = line.split(',')
-                    if len(parts) >= 4:  # Changed from 5 to 4 to handle outdoor format
-                        # Format: "DD/MM/YYYY HH:MM,sample_size,temperature,pressure[,humidity]"
-                        datetime_str = parts[0].strip()  # Already contains both date and time
-                        sample_size = int(parts[1].strip())
-                        temperature = float(parts[2].strip())
-                        pressure = float(parts[3].strip())
-                        
-                        # Handle humidity - might be missing or "N/A" for outdoor data
-                        humidity = None
-                        if len(parts) >= 5:
-                            humidity_str = parts[4].strip()
-                            if humidity_str.upper() not in ['N/A', 'NA', '']:
-                                try:
-                                    humidity = float(humidity_str)
-                                except ValueError:
-                                    humidity = None
-                        
-                        parsed_data.append({
-                            'datetime': datetime_str,
-                            'sample_size': sample_size,
-                            'temperature': temperature,
-                            'pressure': pressure,
-                            'humidity': humidity if humidity is not None else pd.NA
-                        })
-                    else:
-                        self.logger.warning(f"Line {i+1} has insufficient data ({len(parts)} parts): {line}")
-                except (ValueError, IndexError) as e:
-                    self.logger.warning(f"Error parsing line {i+1}: {line} - {e}")
-                    continue
-            
-            if not parsed_data:
+            if df.empty:
                 self.logger.warning("No valid data parsed from CSV")
                 return pd.DataFrame()
             
-            df = pd.DataFrame(parsed_data)
-            df['datetime'] = pd.to_datetime(df['datetime'], format='%d/%m/%Y %H:%M')
-            self.logger.info(f"Successfully parsed {len(df)} records from CSV")
-            self.logger.debug(f"Data range: {df['datetime'].min()} to {df['datetime'].max()}")
+            self.logger.info("Successfully parsed %d records from CSV", len(df))
+            if _DEBUG:
+                self.logger.debug("Data range: %s to %s", df['datetime'].min(), df['datetime'].max())
+            self._store_cached_parse(cache_path, df)
             return df
         except Exception as e:
             self.logger.error(f"Error parsing CSV content: {e}")
             self.logger.debug(f"Full traceback: {traceback.format_exc()}")
             return pd.DataFrame()
     
+    def _parse_cache_path(self, content: bytes):
+        """Parquet path for this CSV content, or None when the disk cache is off"""
+        if not PARSE_CACHE_ENABLED:
+            return None
+        digest = hashlib.sha1(content).hexdigest()
+        return os.path.join(PARSE_CACHE_DIR, f"{digest}.v{PARSE_CACHE_VERSION}.parquet")
+    
+    def _load_cached_parse(self, path):
+        """Load a previously parsed CSV from the disk cache, or None on a miss"""
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            df = pd.read_parquet(path, engine='pyarrow')
+            os.utime(path)  # Recently used files survive pruning
+            self.logger.debug("Loaded %d cached records from %s", len(df), path)
+            return df
+        except Exception as e:
+            self.logger.warning("Ignoring unreadable parse cache file %s: %s", path, e)
+            return None
+    
+    def _store_cached_parse(self, path, df: pd.DataFrame):
+        """Write a parsed CSV to the disk cache; failures only cost a re-parse later"""
+        if path is None:
+            return
+        try:
+            os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            df.to_parquet(tmp_path, engine='pyarrow', compression='zstd', index=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.warning("Could not write parse cache file %s: %s", path, e)
+            return
+        # Listing the directory on every write would add up over a first run's
+        # hundreds of files, so prune on the first write and every 100th after
+        self._parse_cache_stores += 1
+        if self._parse_cache_stores % 100 == 1:
+            self._prune_parse_cache()
+    
+    def _prune_parse_cache(self):
+        """Delete cached parses from other cache versions and all but the newest PARSE_CACHE_MAX_FILES"""
+        suffix = f".v{PARSE_CACHE_VERSION}.parquet"
+        current, stale = [], []
+        try:
+            with os.scandir(PARSE_CACHE_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith(suffix):
+                        try:
+                            current.append((entry.stat().st_mtime, entry.path))
+                        except OSError:
+                            continue  # Removed while listing
+                    elif entry.name.endswith('.parquet'):
+                        stale.append(entry.path)
+        except OSError as e:
+            self.logger.warning("Could not list parse cache %s: %s", PARSE_CACHE_DIR, e)
+            return
+        current.sort(reverse=True)
+        stale.extend(path for _, path in current[PARSE_CACHE_MAX_FILES:])
+        for path in stale:
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # Already removed, e.g. by another worker pruning at the same time
+        if stale:
+            self.logger.info("Pruned %d parse cache files", len(stale))
+    
+    def clear_parse_cache(self):
+        """Delete all on-disk parsed CSVs"""
+        self.logger.info("Clearing parse cache at %s", PARSE_CACHE_DIR)
+        shutil.rmtree(PARSE_CACHE_DIR, ignore_errors=True)
+    
+    def _get_parsed(self, date_str: str, kind: str) -> pd.DataFrame:
+        """Return the parsed DataFrame for a cached date, parsing it on first use"""
+        key = (date_str, kind)
+        df = self._parsed_cache.get(key)
+        if df is None:
+            cache = self.data_cache if kind == 'indoor' else self.outdoor_data_cache
+            df = self.parse_csv_content(cache[date_str])
+            self._parsed_cache[key] = df
+        return df
+    
+    def _combine_frames(self, frames: list) -> pd.DataFrame:
+        """Concatenate per-day frames, sorting by time only if they arrive out of order"""
+        combined = pd.concat(frames, ignore_index=True, sort=False)
+        timestamps = combined['datetime'].to_numpy().view('i8')
+        if len(timestamps) > 1 and np.diff(timestamps).min() < 0:
+            self.logger.debug("Combined data is out of order, sorting by datetime")
+            combined.sort_values('datetime', kind='stable', inplace=True, ignore_index=True)
+        return combined
+    
+    def _start_worker(self, fn, on_finished, on_error, *args) -> bool:
+        """Run fn(*args) on the thread pool, disabling plot/export until it reports back"""
+        if self._worker is not None:
+            self.logger.warning("Data processing already in progress, ignoring request")
+            return False
+        
+        self.plot_btn.setEnabled(False)
+        self.export_btn.setEnabled(False)
+        worker = DataWorker(fn, *args)
+        worker.signals.finished.connect(lambda result: self._finish_worker(on_finished, result))
+        worker.signals.error.connect(lambda message, tb: self._finish_worker(on_error, message, tb))
+        self._worker = worker
+        QThreadPool.globalInstance().start(worker)
+        return True
+    
+    def _finish_worker(self, callback, *args):
+        """Re-enable the data actions, then hand the worker's result to callback"""
+        self._worker = None
+        self.plot_btn.setEnabled(True)
+        self.export_btn.setEnabled(True)
+        try:
+            callback(*args)
+        finally:
+            if self._pending_download is not None:
+                pending, self._pending_download = self._pending_download, None
+                self._apply_download(*pending)
+            if self._replot_pending:
+                self._replot_pending = False
+                self.generate_plot()
+    
+    def _collect_data(self, start_dt: datetime, end_dt: datetime, all_outdoor: bool = False):
+        """Parse and combine the cached days in range.
+        
+        Outdoor data is taken only for days that also have indoor data unless
+        all_outdoor is set. Returns (indoor_df, outdoor_df, indoor_files, outdoor_files);
+        indoor_df is None when there is no valid indoor data and outdoor_df is None
+        when there is no outdoor data.
+        """
+        dates = dates_in_range(start_dt, end_dt)
+        dates_to_process = [d for d in dates if d in self.data_cache]
+        self.logger.debug(f"Found {len(dates_to_process)} dates with indoor data in selected range")
+        
+        # Parse indoor and outdoor (if available) data for each date
+        indoor_data = [df for df in (self._get_parsed(d, 'indoor') for d in dates_to_process)
+                       if not df.empty]
+        if len(indoor_data) < len(dates_to_process):
+            self.logger.warning("No valid indoor data found for %d dates",
+                                len(dates_to_process) - len(indoor_data))
+        outdoor_data = [df for df in (self._get_parsed(d, 'outdoor')
+                                      for d in (dates if all_outdoor else dates_to_process)
+                                      if d in self.outdoor_data_cache)
+                        if not df.empty]
+        self.logger.info(f"Total outdoor data files processed: {len(outdoor_data)}")
+        
+        if not indoor_data:
+            return None, None, 0, len(outdoor_data)
+        
+        combined_indoor_df = self._combine_frames(indoor_data)
+        self.logger.info(f"Combined indoor data: {len(combined_indoor_df)} total records")
+        combined_outdoor_df = None
+        if outdoor_data:
+            combined_outdoor_df = self._combine_frames(outdoor_data)
+            self.logger.info(f"Combined outdoor data: {len(combined_outdoor_df)} total records")
+        return combined_indoor_df, combined_outdoor_df, len(indoor_data), len(outdoor_data)
+    
     def generate_plot(self):
         """Generate time series plots for selected date range"""
         self.logger.info("Starting plot generation")
         
+        if self._worker is not None:
+            # Replot with the latest selection once the current job is done
+            self._replot_pending = True
+            return
+        
         start_date = self.start_date_combo.currentText()
         end_date = self.end_date_combo.currentText()
         
@@ -473,72 +690,14 @@ class EnvironmentalDataPlotter(QMainWindow):
         
         try:
             # Validate date range
-            start_dt = datetime.strptime(start_date, "%d/%m/%Y")
-            end_dt = datetime.strptime(end_date, "%d/%m/%Y")
+            start_dt = parse_date(start_date)
+            end_dt = parse_date(end_date)
             
             if start_dt > end_dt:
                 self.logger.warning(f"Invalid date range: start ({start_date}) > end ({end_date})")
                 QMessageBox.warning(self, "Date Error", "Start date must be before or equal to end date")
                 return
             
-            self.status_bar.showMessage("Processing data and generating plots...")
-            self.logger.debug("Collecting data for selected date range")
-            
-            # Collect indoor data for selected range
-            indoor_data = []
-            outdoor_data = []
-            dates_to_process = []
-            
-            # Find all dates in range
-            current_dt = start_dt
-            while current_dt <= end_dt:
-                date_str = current_dt.strftime("%d/%m/%Y")
-                if date_str in self.data_cache:
-                    dates_to_process.append(date_str)
-                current_dt += timedelta(days=1)
-            
-            self.logger.debug(f"Found {len(dates_to_process)} dates with indoor data in selected range")
-            
-            # Parse indoor data for each date
-            for date_str in dates_to_process:
-                self.logger.debug(f"Processing indoor data for {date_str}")
-                content = self.data_cache[date_str]
-                df = self.parse_csv_content(content)
-                if not df.empty:
-                    indoor_data.append(df)
-                else:
-                    self.logger.warning(f"No valid indoor data found for {date_str}")
-            
-            # Parse outdoor data for each date (if available)
-            for date_str in dates_to_process:
-                if date_str in self.outdoor_data_cache:
-                    self.logger.debug(f"Processing outdoor data for {date_str}")
-                    content = self.outdoor_data_cache[date_str]
-                    df = self.parse_csv_content(content)
-                    if not df.empty:
-                        outdoor_data.append(df)
-            
-            self.logger.info(f"Total outdoor data files processed: {len(outdoor_data)}")
-            
-            if not indoor_data:
-                self.logger.warning("No indoor data found in selected date range")
-                QMessageBox.warning(self, "No Data", "No indoor data available for the selected date range")
-                self.status_bar.showMessage("Ready")
-                return
-            
-            # Combine indoor data
-            combined_indoor_df = pd.concat(indoor_data, ignore_index=True)
-            combined_indoor_df = combined_indoor_df.sort_values('datetime')
-            
-            # Combine outdoor data if available
-            combined_outdoor_df = None
-            if outdoor_data:
-                combined_outdoor_df = pd.concat(outdoor_data, ignore_index=True)
-                combined_outdoor_df = combined_outdoor_df.sort_values('datetime')
-                self.logger.info(f"Combined outdoor data: {len(combined_outdoor_df)} total records")
-            
-            self.logger.info(f"Combined indoor data: {len(combined_indoor_df)} total records")
-            
             # Get smoothing parameters from UI
             smoothing_text = self.smoothing_combo.currentText()
             smoothing_method = self.smoothing_method_combo.currentText().lower()
@@ -556,24 +715,53 @@ class EnvironmentalDataPlotter(QMainWindow):
             }
             smoothing_window = smoothing_map.get(smoothing_text, 1)
             
-            # Create plots with smoothing
-            self.logger.debug(f"Creating time series plots with {smoothing_method} smoothing (window={smoothing_window})")
-            self.canvas.create_time_series_plots(combined_indoor_df, combined_outdoor_df, 
-                                     smoothing_window, smoothing_method)
-
+            self.status_bar.showMessage("Processing data and generating plots...")
+            self.logger.debug("Collecting data for selected date range")
+            self._start_worker(self._prepare_plot, self._on_plot_ready, self._on_plot_error,
+                               start_dt, end_dt, smoothing_window, smoothing_method,
+                               (start_date, end_date), self.canvas.plot_points_target(),
+                               self.canvas.needs_feels_like())
+        except Exception as e:
+            self._on_plot_error(str(e), traceback.format_exc())
+    
+    def _prepare_plot(self, start_dt, end_dt, smoothing_window, smoothing_method, cache_key, n_out, feels_like):
+        """Worker-thread half of generate_plot: everything up to the matplotlib draw"""
+        combined_indoor_df, combined_outdoor_df, _, _ = self._collect_data(start_dt, end_dt)
+        if combined_indoor_df is None:
+            return None
+        
+        self.logger.debug(f"Preparing time series plots with {smoothing_method} smoothing (window={smoothing_window})")
+        return self.canvas.prepare_plot_data(combined_indoor_df, combined_outdoor_df,
+                                             smoothing_window, smoothing_method, cache_key, n_out, feels_like)
+    
+    def _on_plot_ready(self, prepared):
+        """Draw the plots prepared by the worker"""
+        if prepared is None:
+            self.logger.warning("No indoor data found in selected date range")
+            QMessageBox.warning(self, "No Data", "No indoor data available for the selected date range")
+            self.status_bar.showMessage("Ready")
+            return
+        
+        try:
+            self.canvas.draw_prepared_plots(prepared)
             
-            plot_info = f"Plot generated successfully - {len(combined_indoor_df)} indoor data points"
-            if combined_outdoor_df is not None:
-                plot_info += f", {len(combined_outdoor_df)} outdoor data points"
+            indoor_df, outdoor_df = prepared[0], prepared[1]
+            plot_info = f"Plot generated successfully - {len(indoor_df)} indoor data points"
+            if outdoor_df is not None:
+                plot_info += f", {len(outdoor_df)} outdoor data points"
             
             self.status_bar.showMessage(plot_info)
             self.logger.info("Plot generation completed successfully")
         except Exception as e:
-            error_msg = f"Error generating plot: {str(e)}"
-            self.logger.error(error_msg)
-            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
-            QMessageBox.critical(self, "Plot Error", error_msg)
-            self.status_bar.showMessage("Plot generation failed")
+            self._on_plot_error(str(e), traceback.format_exc())
+    
+    def _on_plot_error(self, message: str, tb: str):
+        """Report a failed plot generation"""
+        error_msg = f"Error generating plot: {message}"
+        self.logger.error(error_msg)
+        self.logger.debug(f"Full traceback: {tb}")
+        QMessageBox.critical(self, "Plot Error", error_msg)
+        self.status_bar.showMessage("Plot generation failed")
     
     def export_data(self):
         """Export selected data to CSV file"""
@@ -593,7 +781,7 @@ class EnvironmentalDataPlotter(QMainWindow):
             # Get save location
             self.logger.debug("Opening file save dialog")
             filename, _ = QFileDialog.getSaveFileName(
-                self, "Export Environmental Data", "", "CSV files (*.csv);;All files (*.*)"
+                self, "Export Environmental Data", "", "CSV files (*.csv *.csv.gz);;All files (*.*)"
             )
             
             if not filename:
@@ -603,76 +791,67 @@ class EnvironmentalDataPlotter(QMainWindow):
             self.logger.info(f"Exporting data to: {filename}")
             
             # Validate date range
-            start_dt = datetime.strptime(start_date, "%d/%m/%Y")
-            end_dt = datetime.strptime(end_date, "%d/%m/%Y")
-            
-            # Collect and combine indoor data
-            indoor_data = []
-            outdoor_data = []
-            current_date = start_dt
-            
-            while current_date <= end_dt:
-                date_str = current_date.strftime("%d/%m/%Y")
-                if date_str in self.data_cache:
-                    df = self.parse_csv_content(self.data_cache[date_str])
-                    if not df.empty:
-                        indoor_data.append(df)
-                
-                # Check for outdoor data
-                if date_str in self.outdoor_data_cache:
-                    df_outdoor = self.parse_csv_content(self.outdoor_data_cache[date_str])
-                    if not df_outdoor.empty:
-                        outdoor_data.append(df_outdoor)
-                
-                current_date += timedelta(days=1)
-            
-            if not indoor_data:
-                QMessageBox.warning(self, "No Data", "No indoor data available for selected date range")
-                return
+            start_dt = parse_date(start_date)
+            end_dt = parse_date(end_date)
             
-            # Combine indoor data
-            combined_indoor_df = pd.concat(indoor_data, ignore_index=True)
-            combined_indoor_df = combined_indoor_df.sort_values('datetime')
-            
-            # Add feels like temperature to indoor data
-            feels_like_temp = []
-            temp_canvas = MatplotlibCanvas()  # Temporary instance for calculation
-            for _, row in combined_indoor_df.iterrows():
-                feels_like = temp_canvas.calculate_heat_index(row['temperature'], row['humidity'])
-                feels_like_temp.append(feels_like)
-            combined_indoor_df['feels_like'] = feels_like_temp
-            
-            # Format datetime for export
-            combined_indoor_df['Date/Time'] = combined_indoor_df['datetime'].dt.strftime('%d/%m/%Y %H:%M')
-            
-            # Prepare export dataframe
-            export_columns = ['Date/Time', 'sample_size', 'temperature', 'pressure', 'humidity', 'feels_like']
-            export_df = combined_indoor_df[export_columns].copy()
-            export_df.columns = ['Date/Time', 'Sample Size', 'Indoor Temperature (°C)', 'Indoor Pressure (hPa)', 'Humidity (%RH)', 'Feels Like (°C)']
-            
-            # Add outdoor data if available
-            if outdoor_data:
-                combined_outdoor_df = pd.concat(outdoor_data, ignore_index=True)
-                combined_outdoor_df = combined_outdoor_df.sort_values('datetime')
-                combined_outdoor_df['Date/Time'] = combined_outdoor_df['datetime'].dt.strftime('%d/%m/%Y %H:%M')
-                
-                outdoor_export = combined_outdoor_df[['Date/Time', 'temperature', 'pressure']]
-                outdoor_export.columns = ['Date/Time', 'Outdoor Temperature (°C)', 'Outdoor Pressure (hPa)']
-                
-                export_df = pd.merge(export_df, outdoor_export, on='Date/Time', how='left')
-            
-            export_df.to_csv(filename, index=False)
-            
-            export_info = f"Data exported successfully to {filename}"
-            if outdoor_data:
-                export_info += f" (includes {len(indoor_data)} indoor and {len(outdoor_data)} outdoor data files)"
-            else:
-                export_info += f" (includes {len(indoor_data)} indoor data files)"
-            
-            QMessageBox.information(self, "Export Success", export_info)
-            self.status_bar.showMessage(f"Data exported to {os.path.basename(filename)}")
+            self.status_bar.showMessage("Exporting data...")
+            self._start_worker(self._write_export, self._on_export_done, self._on_export_error,
+                               filename, start_dt, end_dt)
         except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Error exporting data: {str(e)}")
+            self._on_export_error(str(e), traceback.format_exc())
+    
+    def _write_export(self, filename: str, start_dt: datetime, end_dt: datetime):
+        """Worker-thread half of export_data; returns a summary, or None without data"""
+        combined_indoor_df, combined_outdoor_df, indoor_files, outdoor_files = self._collect_data(
+            start_dt, end_dt, all_outdoor=True)
+        if combined_indoor_df is None:
+            return None
+        
+        # Add feels like temperature to indoor data (just the temperature without humidity)
+        if combined_indoor_df.empty or combined_indoor_df['humidity'].isna().all():
+            combined_indoor_df['feels_like'] = combined_indoor_df['temperature']
+        else:
+            combined_indoor_df['feels_like'] = MatplotlibCanvas.calculate_heat_index_vectorized(
+                combined_indoor_df['temperature'].to_numpy(), combined_indoor_df['humidity'].to_numpy())
+        
+        # Prepare export dataframe, keeping datetime64 keys for the merge
+        export_columns = ['datetime', 'sample_size', 'temperature', 'pressure', 'humidity', 'feels_like']
+        export_df = combined_indoor_df[export_columns]
+        export_df.columns = ['Date/Time', 'Sample Size', 'Indoor Temperature (°C)', 'Indoor Pressure (hPa)', 'Humidity (%RH)', 'Feels Like (°C)']
+        
+        # Add outdoor data if available
+        if combined_outdoor_df is not None:
+            outdoor_export = combined_outdoor_df[['datetime', 'temperature', 'pressure']]
+            outdoor_export.columns = ['Date/Time', 'Outdoor Temperature (°C)', 'Outdoor Pressure (hPa)']
+            
+            export_df = pd.merge(export_df, outdoor_export, on='Date/Time', how='left')
+        
+        # Timestamps are formatted only while writing; a .gz name is gzip-compressed
+        export_df.to_csv(filename, index=False, date_format='%d/%m/%Y %H:%M',
+                         chunksize=50_000, lineterminator='\n', compression='infer')
+        
+        export_info = f"Data exported successfully to {os.path.basename(filename)}"
+        if outdoor_files:
+            export_info += f" (includes {indoor_files} indoor and {outdoor_files} outdoor data files)"
+        else:
+            export_info += f" (includes {indoor_files} indoor data files)"
+        return export_info
+    
+    def _on_export_done(self, export_info):
+        """Report the outcome of a finished export"""
+        if export_info is None:
+            QMessageBox.warning(self, "No Data", "No indoor data available for selected date range")
+            self.status_bar.showMessage("Ready")
+            return
+        
+        self.logger.info(export_info)
+        self.status_bar.showMessage(export_info, 5000)
+    
+    def _on_export_error(self, message: str, tb: str):
+        """Report a failed export"""
+        self.logger.debug(f"Full traceback: {tb}")
+        QMessageBox.critical(self, "Export Error", f"Error exporting data: {message}")
+        self.status_bar.showMessage("Export failed")
     
     def change_view(self, view_mode: str):
         """Change the plot view mode"""
@@ -5,33 +5,214 @@ Handles FTP connection and data download for environmental data
 """
 
 import sys
+import hashlib
 import logging
+import os
+import socket
+import threading
+import time
 import traceback
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from PyQt5.QtCore import QThread, pyqtSignal
+import numpy as np
 import pandas as pd
 import ftplib
 import io
 import re
 from typing import List, Optional
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+# Sensor files: DD_MM_YYYY.csv (indoor) or DD_MM_YYYY_outside.csv (outdoor), with the
+# date fields and the outdoor suffix captured for indexing
+_DATE_RE = re.compile(r'^(\d{2})_(\d{2})_(\d{4})(_outside)?\.csv$')
+
+# Sensor CSV layout: "DD/MM/YYYY HH:MM,sample_size,temperature,pressure[,humidity]"
+CSV_COLUMNS = ['datetime', 'sample_size', 'temperature', 'pressure', 'humidity']
+CSV_DATETIME_FORMAT = '%d/%m/%Y %H:%M'
+# float32 is well beyond BME280 resolution; sample_size is read as nullable Int32 so
+# blank counts parse and get dropped and counts outside int16 are dropped rather
+# than wrapped, then stored as plain int16
+CSV_DTYPES = {'sample_size': 'int16', 'temperature': 'float32', 'pressure': 'float32', 'humidity': 'float32'}
+CSV_READ_DTYPES = {**CSV_DTYPES, 'sample_size': 'Int32'}
+SAMPLE_SIZE_RANGE = (np.iinfo(np.int16).min, np.iinfo(np.int16).max)
+CSV_NA_VALUES = ['N/A', 'NA', '']
+# Humidity may be missing or "N/A" for outdoor data; everything else is required
+CSV_REQUIRED = ['datetime', 'sample_size', 'temperature', 'pressure']
+
+# Downloaded CSVs are kept locally and reused while the server's MDTM/SIZE are unchanged
+# (past days never change). PLOTTER_DOWNLOAD_CACHE=0 disables it
+DOWNLOAD_CACHE_ENABLED = os.environ.get('PLOTTER_DOWNLOAD_CACHE', '1') != '0'
+DOWNLOAD_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'bme280', 'downloads')
+
+_csv_logger = logging.getLogger('CSVParser')
+
+
+def _find_data_start(content: bytes):
+    """Offset of the first data row (past blank lines and any header) and its field count"""
+    buf = io.BytesIO(content)
+    data_start = 0
+    line = buf.readline()
+    while line and not line.strip():
+        data_start = buf.tell()
+        line = buf.readline()
+    if line.startswith(b'Date,Sample'):
+        data_start = buf.tell()
+        line = buf.readline()
+    return data_start, line.count(b',') + 1
+
+
+def _read_csv_pyarrow(content: bytes, data_start: int, n_fields: int) -> Optional[pd.DataFrame]:
+    """Strict multithreaded pyarrow read; None if any row needs the lenient pandas path"""
+    names = CSV_COLUMNS[:n_fields]
+    invalid_rows = []
+    
+    def skip_invalid(row):
+        invalid_rows.append(row.number)
+        return 'skip'
+    
+    types = {'datetime': pa.timestamp('ns'), 'sample_size': pa.int32(), 'temperature': pa.float32(),
+             'pressure': pa.float32(), 'humidity': pa.float32()}
+    try:
+        table = pacsv.read_csv(
+            pa.BufferReader(pa.py_buffer(content).slice(data_start)),
+            read_options=pacsv.ReadOptions(column_names=names),
+            parse_options=pacsv.ParseOptions(invalid_row_handler=skip_invalid),
+            convert_options=pacsv.ConvertOptions(column_types={n: types[n] for n in names},
+                                                 timestamp_parsers=[CSV_DATETIME_FORMAT],
+                                                 null_values=CSV_NA_VALUES,
+                                                 strings_can_be_null=True))
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        _csv_logger.debug("pyarrow could not parse CSV strictly (%s), using pandas", e)
+        return None
+    if invalid_rows:
+        # Ragged rows (e.g. mixed 4/5-column lines) are salvaged row by row by pandas
+        return None
+    
+    df = table.to_pandas(self_destruct=True)
+    for column in CSV_COLUMNS[n_fields:]:
+        df[column] = np.float32(np.nan)
+    return df
+
+
+def _read_csv_pandas(content: bytes, data_start: int) -> pd.DataFrame:
+    """pandas C-parser read that coerces malformed values to NaN instead of failing"""
+    # Undecodable bytes only spoil their own row, which is dropped afterwards. Spare
+    # names give rows with a sixth field (e.g. a trailing comma) somewhere to go, and
+    # index_col=False keeps pandas from shifting them into the index; short 4-field
+    # outdoor rows are padded with NaN. Only the first five fields are kept, as the
+    # old line parser did
+    read_options = dict(names=CSV_COLUMNS + ['_spare1', '_spare2', '_spare3'],
+                        header=None, index_col=False,
+                        na_values=CSV_NA_VALUES,
+                        engine='c', skip_blank_lines=True, on_bad_lines='skip',
+                        encoding='utf-8', encoding_errors='replace')
+    buf = io.BytesIO(content)
+    try:
+        buf.seek(data_start)
+        df = pd.read_csv(buf, dtype=CSV_READ_DTYPES, **read_options)
+    except ValueError as e:
+        # Truncated or corrupted rows break the typed parse - re-read untyped
+        # and coerce, so only the offending rows are dropped
+        _csv_logger.warning("Malformed rows in CSV content, parsing leniently: %s", e)
+        buf.seek(data_start)
+        df = pd.read_csv(buf, dtype=str, **read_options)
+        for col in ['sample_size', 'temperature', 'pressure', 'humidity']:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    
+    df = df[CSV_COLUMNS]
+    df['datetime'] = pd.to_datetime(df['datetime'], format=CSV_DATETIME_FORMAT,
+                                    errors='coerce', cache=True)
+    return df
+
+
+def _coerce_csv_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert df to the CSV dtypes value by value, dropping rows that don't convert"""
+    df = df.assign(
+        datetime=pd.to_datetime(df['datetime'], format=CSV_DATETIME_FORMAT, errors='coerce')
+        if df['datetime'].dtype == object else df['datetime'],
+        **{col: pd.to_numeric(df[col], errors='coerce') for col in CSV_DTYPES})
+    df = df.dropna(subset=CSV_REQUIRED)
+    df = df[df['sample_size'].between(*SAMPLE_SIZE_RANGE)]
+    return df.astype({'datetime': 'datetime64[ns]', **CSV_DTYPES})
+
+
+def parse_csv_bytes(content: bytes) -> pd.DataFrame:
+    """Parse raw sensor CSV bytes into a typed DataFrame with CSV_COLUMNS.
+    
+    Uses pyarrow's CSV reader when it is installed and the file is clean, and
+    pandas' C parser otherwise. Rows with an unparseable timestamp or a missing
+    required reading are dropped. Timestamps are datetime64[ns].
+    """
+    data_start, n_fields = _find_data_start(content)
+    
+    df = None
+    if pa is not None and 4 <= n_fields <= len(CSV_COLUMNS):
+        df = _read_csv_pyarrow(content, data_start, n_fields)
+    if df is None:
+        df = _read_csv_pandas(content, data_start)
+    
+    total_rows = len(df)
+    df = df.dropna(subset=CSV_REQUIRED)
+    df = df[df['sample_size'].between(*SAMPLE_SIZE_RANGE)]
+    if len(df) < total_rows:
+        _csv_logger.warning("Skipped %d invalid lines in CSV content", total_rows - len(df))
+    
+    try:
+        df = df.astype({'datetime': 'datetime64[ns]', **CSV_DTYPES})
+    except (TypeError, ValueError) as e:
+        # Values the readers let through but that don't fit the dtypes cost their rows, not the file
+        _csv_logger.warning("Unconvertible values in CSV content, dropping their rows: %s", e)
+        df = _coerce_csv_columns(df)
+    return df.reset_index(drop=True)
+
 
 class FTPDataManager:
     """Handles FTP connection and data download"""
     
-    def __init__(self):
-        self.logger = logging.getLogger('FTPDataManager')
+    # Bytes requested per recv() on the data connection (ftplib defaults to 8 KiB)
+    RETR_BLOCKSIZE = 1 << 18
+    # Idle seconds before TCP keepalive probes start on the control connection
+    KEEPALIVE_IDLE = 60
+    
+    logger = logging.getLogger('FTPDataManager')
+    
+    def __init__(self, cache_dir: Optional[str] = None):
         self.logger.debug("FTPDataManager initialized")
         self.host = ""
         self.username = ""
         self.password = ""
         self.directory = ""
         self.connection = None
+        self.cache_dir = cache_dir  # Local copies for download_file_cached; None disables
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        self.disconnect()
+        return False
+    
+    def _tune_control_socket(self):
+        """Disable Nagle and enable keepalive so a long download session isn't dropped while idle"""
+        sock = self.connection.sock
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, 'TCP_KEEPIDLE'):  # Linux only
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.KEEPALIVE_IDLE)
+        except OSError as e:
+            self.logger.debug("Could not tune FTP control socket: %s", e)
     
     def connect(self, host: str, username: str, password: str, directory: str = "") -> bool:
         """Connect to FTP server"""
-        self.logger.info(f"Attempting FTP connection to {host}:21")
-        self.logger.debug(f"Connection parameters - Host: {host}, Username: {username}, Directory: '{directory}'")
+        self.logger.info("Attempting FTP connection to %s:21", host)
+        self.logger.debug("Connection parameters - Host: %s, Username: %s, Directory: '%s'", host, username, directory)
         
         try:
             self.host = host
@@ -42,44 +223,70 @@ class FTPDataManager:
             self.logger.debug("Creating FTP connection object")
             self.connection = ftplib.FTP()
             
-            self.logger.debug(f"Connecting to {host}:21 with 30s timeout")
+            self.logger.debug("Connecting to %s:21 with 30s timeout", host)
             self.connection.connect(host, 21, timeout=30)
             self.logger.info("TCP connection to FTP server established")
+            self._tune_control_socket()
             
-            self.logger.debug(f"Logging in with username: {username}")
+            self.logger.debug("Logging in with username: %s", username)
             self.connection.login(username, password)
             self.logger.info("FTP login successful")
             
             if directory:
-                self.logger.debug(f"Changing to directory: {directory}")
+                self.logger.debug("Changing to directory: %s", directory)
                 self.connection.cwd(directory)
-                self.logger.info(f"Successfully changed to directory: {directory}")
+                self.logger.info("Successfully changed to directory: %s", directory)
             else:
                 self.logger.debug("No directory specified, staying in root")
             
+            # Passive mode is ftplib's default; set it explicitly since routers behind NAT need it
+            self.connection.set_pasv(True)
+            # Binary mode up front: many servers refuse SIZE in ASCII mode
+            self.connection.voidcmd('TYPE I')
+            
             self.logger.info("FTP connection fully established")
             return True
             
         except ftplib.error_perm as e:
-            self.logger.error(f"FTP Permission error: {e}")
+            self.logger.error("FTP Permission error: %s", e)
             return False
         except ftplib.error_temp as e:
-            self.logger.error(f"FTP Temporary error: {e}")
+            self.logger.error("FTP Temporary error: %s", e)
             return False
         except ConnectionRefusedError as e:
-            self.logger.error(f"Connection refused: {e}")
+            self.logger.error("Connection refused: %s", e)
             return False
         except TimeoutError as e:
-            self.logger.error(f"Connection timeout: {e}")
+            self.logger.error("Connection timeout: %s", e)
             return False
         except OSError as e:
-            self.logger.error(f"Network error: {e}")
+            self.logger.error("Network error: %s", e)
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected FTP connection error: {e}")
-            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
+            self.logger.error("Unexpected FTP connection error: %s", e)
+            self.logger.debug("Full traceback: %s", traceback.format_exc())
+            return False
+    
+    def is_connected(self) -> bool:
+        """Probe the control connection with NOOP"""
+        if not self.connection:
+            return False
+        try:
+            self.connection.voidcmd('NOOP')
+            return True
+        except (ftplib.Error, OSError, EOFError) as e:
+            self.logger.debug("FTP connection is no longer usable: %s", e)
             return False
     
+    def ensure_connected(self, host: str, username: str, password: str, directory: str = "") -> bool:
+        """Reuse the live session for the same server/login/directory, otherwise (re)connect"""
+        if (host, username, password, directory) == (self.host, self.username, self.password, self.directory) \
+                and self.is_connected():
+            self.logger.info("Reusing existing FTP connection to %s", host)
+            return True
+        self.disconnect()
+        return self.connect(host, username, password, directory)
+    
     def disconnect(self):
         """Disconnect from FTP server"""
         self.logger.debug("Attempting to disconnect from FTP server")
@@ -89,13 +296,14 @@ class FTPDataManager:
                 self.logger.debug("Sending QUIT command to FTP server")
                 self.connection.quit()
                 self.logger.info("FTP connection closed gracefully")
-            except (ftplib.error_temp, ftplib.error_perm, OSError) as e:
-                self.logger.warning(f"Error during graceful disconnect: {e}, forcing close")
+            except (ftplib.Error, OSError, EOFError, AttributeError) as e:
+                # AttributeError: a connect() that failed before the socket opened leaves none to QUIT on
+                self.logger.warning("Error during graceful disconnect: %s, forcing close", e)
                 try:
                     self.connection.close()
                     self.logger.info("FTP connection forcefully closed")
                 except Exception as e:
-                    self.logger.error(f"Error forcing connection close: {e}")
+                    self.logger.error("Error forcing connection close: %s", e)
             
             self.connection = None
             self.logger.debug("FTP connection object cleared")
@@ -104,6 +312,29 @@ class FTPDataManager:
     
     def list_csv_files(self) -> List[str]:
         """List all CSV files on the FTP server"""
+        return [name for name, _, _ in self.list_csv_entries()]
+    
+    def _list_entries(self) -> List[tuple]:
+        """(name, size, modify) for every directory entry; size/modify are None without MLSD"""
+        try:
+            self.logger.debug("Executing MLSD command on FTP server")
+            return [(name, int(facts['size']) if 'size' in facts else None, facts.get('modify'))
+                    for name, facts in self.connection.mlsd(facts=['type', 'size', 'modify'])
+                    if facts.get('type', 'file') == 'file']
+        except ftplib.error_perm as e:
+            # 500/502: MLSD not implemented, as on many router FTP servers
+            self.logger.debug("MLSD unavailable (%s), falling back to NLST", e)
+        
+        self.logger.debug("Executing NLST command on FTP server")
+        # Some servers prefix NLST entries with the directory
+        return [(n.rsplit('/', 1)[-1], None, None) for n in self.connection.nlst()]
+    
+    def list_csv_entries(self) -> List[tuple]:
+        """List sensor CSV files as sorted (name, size, modify) tuples.
+        
+        size and modify come from MLSD facts when the server supports it, which
+        lets the download cache skip its MDTM/SIZE round trips; otherwise None.
+        """
         self.logger.info("Starting to list CSV files on FTP server")
         
         if not self.connection:
@@ -111,121 +342,332 @@ class FTPDataManager:
             return []
         
         try:
-            self.logger.debug("Executing LIST command on FTP server")
-            file_list = []
-            self.connection.retrlines('LIST', file_list.append)
-            self.logger.debug(f"Received {len(file_list)} file entries from server")
-            
-            csv_files = []
-            for i, line in enumerate(file_list):
-                self.logger.debug(f"Processing file entry {i+1}: {line}")
-                
-                # Parse FTP LIST output (format may vary by server)
-                parts = line.split()
-                if len(parts) >= 9 and parts[-1].endswith('.csv'):
-                    filename = parts[-1]
-                    self.logger.debug(f"Found CSV file: {filename}")
-                    
-                    # Look for date pattern DD_MM_YYYY.csv or DD_MM_YYYY_outside.csv
-                    if re.match(r'\d{2}_\d{2}_\d{4}\.csv', filename) or re.match(r'\d{2}_\d{2}_\d{4}_outside\.csv', filename):
-                        csv_files.append(filename)
-                        self.logger.debug(f"CSV file matches date pattern: {filename}")
-                    else:
-                        self.logger.debug(f"CSV file does not match date pattern: {filename}")
-                else:
-                    self.logger.debug(f"File entry ignored (not CSV or invalid format): {line}")
-            
-            sorted_files = sorted(csv_files)
-            self.logger.info(f"Found {len(sorted_files)} valid CSV files with date pattern")
-            self.logger.debug(f"CSV files found: {sorted_files}")
+            entries = self._list_entries()
+            # endswith is a cheap C-level reject for directory junk before the regex runs
+            csv_entries = sorted(entry for entry in entries
+                                 if entry[0].endswith('.csv') and _DATE_RE.match(entry[0]))
+            self.logger.debug("Parsed %d entries, matched %d", len(entries), len(csv_entries))
+            self.logger.info("Found %d valid CSV files with date pattern", len(csv_entries))
             
-            return sorted_files
+            return csv_entries
             
         except ftplib.error_perm as e:
-            self.logger.error(f"Permission error listing files: {e}")
+            self.logger.error("Permission error listing files: %s", e)
             return []
         except ftplib.error_temp as e:
-            self.logger.error(f"Temporary error listing files: {e}")
+            self.logger.error("Temporary error listing files: %s", e)
             return []
         except Exception as e:
-            self.logger.error(f"Unexpected error listing files: {e}")
-            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
+            self.logger.error("Unexpected error listing files: %s", e)
+            self.logger.debug("Full traceback: %s", traceback.format_exc())
             return []
     
-    def download_file(self, filename: str) -> Optional[str]:
-        """Download a file and return its content as string"""
-        self.logger.info(f"Starting download of file: {filename}")
+    def _retr_into(self, filename: str, size: int) -> bytearray:
+        """RETR into a buffer allocated once at the expected size.
+        
+        Today's log may still be growing or be rewritten, so a longer transfer
+        switches to appending and a shorter one is trimmed to what arrived.
+        """
+        buf = bytearray(size)
+        view = memoryview(buf)
+        offset = 0
+        
+        def write(block):
+            nonlocal view, offset
+            end = offset + len(block)
+            if view is not None and end <= size:
+                view[offset:end] = block
+            else:
+                if view is not None:
+                    view.release()  # a bytearray can't be resized while a view is exported
+                    view = None
+                    del buf[offset:]
+                buf.extend(block)
+            offset = end
+        
+        self.connection.retrbinary(f'RETR {filename}', write, blocksize=self.RETR_BLOCKSIZE)
+        if view is not None:
+            view.release()
+            del buf[offset:]
+        return buf
+    
+    def download_file(self, filename: str, size: Optional[int] = None) -> Optional[bytearray]:
+        """Download a file and return its raw (UTF-8) content; pandas parses bytes directly.
+        
+        size is the expected length if already known (listing or cache check);
+        otherwise it is asked for with SIZE so the buffer is allocated once.
+        """
+        self.logger.info("Starting download of file: %s", filename)
         
         if not self.connection:
             self.logger.error("No active FTP connection available for download")
             return None
         
         try:
-            self.logger.debug(f"Creating binary buffer for file: {filename}")
-            file_content = io.BytesIO()
-            
-            self.logger.debug(f"Executing RETR command for: {filename}")
-            self.connection.retrbinary(f'RETR {filename}', file_content.write)
+            if size is None:
+                try:
+                    size = self.connection.size(filename)
+                except (ftplib.error_perm, ftplib.error_reply) as e:
+                    self.logger.debug("SIZE unavailable for %s: %s", filename, e)
             
-            file_size = file_content.tell()
-            self.logger.debug(f"Downloaded {file_size} bytes from {filename}")
+            self.logger.debug("Executing RETR command for: %s", filename)
+            if size:
+                buf = self._retr_into(filename, size)
+            else:
+                # Unknown size: blocks are appended in place, without an intermediate BytesIO copy
+                buf = bytearray()
+                self.connection.retrbinary(f'RETR {filename}', buf.extend, blocksize=self.RETR_BLOCKSIZE)
             
-            self.logger.debug(f"Decoding content from {filename} as UTF-8")
-            content = file_content.getvalue().decode('utf-8')
+            file_size = len(buf)
+            self.logger.debug("Downloaded %d bytes from %s", file_size, filename)
             
-            lines_count = len(content.split('\n'))
-            self.logger.info(f"Successfully downloaded {filename}: {file_size} bytes, {lines_count} lines")
-            self.logger.debug(f"First 100 characters of {filename}: {content[:100]}")
+            # memchr-backed count; a final line without a newline still counts
+            lines_count = buf.count(b'\n') + (1 if buf and not buf.endswith(b'\n') else 0)
+            self.logger.info("Successfully downloaded %s: %d bytes, %d lines", filename, file_size, lines_count)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("First 100 bytes of %s: %s", filename, bytes(buf[:100]))
             
-            return content
+            return buf
             
         except ftplib.error_perm as e:
-            self.logger.error(f"Permission error downloading {filename}: {e}")
+            self.logger.error("Permission error downloading %s: %s", filename, e)
             return None
         except ftplib.error_temp as e:
-            self.logger.error(f"Temporary error downloading {filename}: {e}")
-            return None
-        except UnicodeDecodeError as e:
-            self.logger.error(f"UTF-8 decode error for {filename}: {e}")
+            self.logger.error("Temporary error downloading %s: %s", filename, e)
             return None
         except Exception as e:
-            self.logger.error(f"Unexpected error downloading {filename}: {e}")
-            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
+            self.logger.error("Unexpected error downloading %s: %s", filename, e)
+            self.logger.debug("Full traceback: %s", traceback.format_exc())
+            return None
+    
+    def remote_stat(self, filename: str) -> Optional[tuple]:
+        """(modification time, size) of a remote file via MDTM/SIZE, or None if unavailable"""
+        try:
+            mtime = self.connection.voidcmd(f'MDTM {filename}')[4:].strip()
+            size = self.connection.size(filename)
+        except ftplib.all_errors as e:
+            # Unsupported, a transient 4xx or a dropped connection: the caller just downloads
+            self.logger.debug("MDTM/SIZE unavailable for %s: %s", filename, e)
             return None
+        return (mtime, size) if size is not None else None
+    
+    def download_file_cached(self, filename: str, stat: Optional[tuple] = None) -> Optional[bytearray]:
+        """download_file, served from cache_dir when the remote MDTM/SIZE are unchanged.
+        
+        stat is an already known (modify, size) pair, e.g. from list_csv_entries.
+        """
+        if self.cache_dir is None or not self.connection:
+            return self.download_file(filename, stat[1] if stat else None)
+        
+        if stat is None or None in stat:
+            stat = self.remote_stat(filename)
+        path = os.path.join(self.cache_dir, filename)
+        meta = f"{stat[0]} {stat[1]}" if stat else None
+        if meta is not None:
+            try:
+                with open(path + '.meta', encoding='ascii') as f:
+                    cached_meta = f.read()
+                if cached_meta == meta and os.path.getsize(path) == stat[1]:
+                    buf = bytearray(stat[1])
+                    with open(path, 'rb') as f:
+                        f.readinto(buf)
+                    self.logger.debug("Using cached copy of %s", filename)
+                    return buf
+            except (OSError, ValueError):
+                pass  # Missing or damaged cache entry - download again
+        
+        content = self.download_file(filename, stat[1] if stat else None)
+        if content is not None and meta is not None:
+            self._store_cached_download(path, content, meta)
+        return content
+    
+    def _store_cached_download(self, path: str, content: bytearray, meta: str):
+        """Atomically write a downloaded file and its MDTM/SIZE sidecar"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(path + tmp_suffix, 'wb') as f:
+                f.write(content)
+            os.replace(path + tmp_suffix, path)
+            with open(path + '.meta' + tmp_suffix, 'w', encoding='ascii') as f:
+                f.write(meta)
+            os.replace(path + '.meta' + tmp_suffix, path + '.meta')
+        except OSError as e:
+            self.logger.warning("Could not cache download %s: %s", path, e)
 
 
 class FTPDownloadThread(QThread):
     """Thread for downloading FTP data without blocking UI"""
     
+    # Concurrent FTP sessions used for downloads, the listing session included;
+    # routers often cap sessions per user
+    MAX_WORKERS = 4
+    # Minimum seconds between progress signals so the GUI queue isn't flooded per file
+    PROGRESS_INTERVAL = 0.1
+    
     progress_updated = pyqtSignal(int)
     status_updated = pyqtSignal(str)
     download_complete = pyqtSignal(dict, dict, list)
     download_error = pyqtSignal(str)
     
-    def __init__(self, host, username, password, directory):
+    logger = logging.getLogger('FTPDownloadThread')
+    
+    def __init__(self, host, username, password, directory, max_workers: int = MAX_WORKERS,
+                 ftp_manager: Optional[FTPDataManager] = None):
         super().__init__()
-        self.logger = logging.getLogger('FTPDownloadThread')
         self.logger.debug("FTPDownloadThread initialized")
         
         self.host = host
         self.username = username
         self.password = password
         self.directory = directory
+        self.max_workers = max(1, max_workers)
+        
+        self.logger.debug("Thread configured - Host: %s, Username: %s, Directory: '%s'", host, username, directory)
         
-        self.logger.debug(f"Thread configured - Host: {host}, Username: {username}, Directory: '{directory}'")
+        # One cache directory per server and remote directory
+        self.cache_dir = None
+        if DOWNLOAD_CACHE_ENABLED:
+            source = hashlib.sha1(f"{host}:{directory}".encode('utf-8')).hexdigest()[:16]
+            self.cache_dir = os.path.join(DOWNLOAD_CACHE_DIR, source)
+        
+        # A caller-owned manager keeps its listing connection open between runs
+        self.ftp_manager = ftp_manager
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions = None  # ExitStack that closes this run's own FTP sessions
+        self._listing_manager = None  # Fetches as one of the workers, so it counts against max_workers
+        self._listing_claimed = False
+        self._completed = 0
+        self._last_emit_t = 0.0
+        self._last_status_date = None
+        self._remote_stats = {}  # filename -> (modify, size) from the listing
+    
+    def _worker_manager(self) -> Optional[FTPDataManager]:
+        """Return this worker thread's FTP session, opening it on first use.
+        
+        The first worker takes over the listing session, so at most max_workers
+        sessions are logged in at once.
+        """
+        if not hasattr(self._local, 'manager'):
+            with self._lock:
+                claim_listing = not self._listing_claimed
+                self._listing_claimed = True
+            if claim_listing:
+                manager = self._listing_manager
+            else:
+                manager = FTPDataManager(self.cache_dir)
+                if manager.connect(self.host, self.username, self.password, self.directory):
+                    with self._lock:
+                        self._sessions.enter_context(manager)
+                else:
+                    # Typically 421 (too many connections) - close whatever the failed
+                    # attempt opened and leave this worker's files to the listing connection
+                    self.logger.warning("Could not open an extra FTP session for worker thread")
+                    manager.disconnect()
+                    manager = None
+            self._local.manager = manager
+        return self._local.manager
+    
+    def _fetch_one(self, filename: str, total: int):
+        """Download one file on this worker's session; returns (filename, content, had_session)"""
+        manager = self._worker_manager()
+        content = None
+        if manager is not None:
+            # Indoor and outdoor files of a day sort together; announce each day once
+            date_part = filename[:10]
+            with self._lock:
+                announce = date_part != self._last_status_date
+                self._last_status_date = date_part
+            if announce:
+                self.status_updated.emit(f"Downloading {filename}...")
+            content = self._fetch_cached(manager, filename)
+        
+        with self._lock:
+            self._completed += 1
+            completed = self._completed
+            progress = int((completed / total) * 100)
+            now = time.monotonic()
+            emit = progress == 100 or now - self._last_emit_t >= self.PROGRESS_INTERVAL
+            if emit:
+                self._last_emit_t = now
+        self.logger.debug("Download progress: %d%% (%d/%d)", progress, completed, total)
+        if emit:
+            self.progress_updated.emit(progress)
+        return filename, content, manager is not None
+    
+    def _fetch_cached(self, manager: FTPDataManager, filename: str) -> Optional[bytearray]:
+        """download_file_cached, with any failure costing only this file (None)"""
+        try:
+            return manager.download_file_cached(filename, self._remote_stats.get(filename))
+        except Exception as e:
+            # Escaping here would abort the whole run (pool.map re-raises)
+            self.logger.error("Unexpected error fetching %s: %s", filename, e)
+            self.logger.debug("Full traceback: %s", traceback.format_exc())
+            return None
+    
+    def _fetch_serial(self, ftp_manager: FTPDataManager, filename: str) -> Optional[bytearray]:
+        """Download a file that no worker session could take"""
+        self.logger.info("Downloading %s over the listing connection", filename)
+        return self._fetch_cached(ftp_manager, filename)
+    
+    def _index_downloads(self, results: List[tuple]) -> tuple:
+        """Map downloaded (filename, content) pairs to (indoor, outdoor, dates) by filename date"""
+        data_cache = {}
+        outdoor_data_cache = {}
+        available_dates = set()
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        
+        for filename, content in results:
+            if not content:
+                self.logger.error("Failed to download content for %s", filename)
+                continue
+            
+            # Parse date (and indoor/outdoor) from filename
+            date_match = _DATE_RE.match(filename)
+            if not date_match:
+                self.logger.warning("File %s does not match expected date pattern", filename)
+                continue
+            
+            day, month, year, outside = date_match.groups()
+            date_str = f"{day}/{month}/{year}"
+            if outside is not None:
+                outdoor_data_cache[date_str] = content
+                if debug:
+                    self.logger.debug("Outdoor file %s mapped to date: %s", filename, date_str)
+                    self.logger.debug("Outdoor content preview: %s", bytes(content[:150]))
+            else:
+                data_cache[date_str] = content
+                if debug:
+                    self.logger.debug("Indoor file %s mapped to date: %s", filename, date_str)
+            available_dates.add(date_str)
+        
+        return data_cache, outdoor_data_cache, available_dates
     
     def run(self):
         """Run the download process in a separate thread"""
         self.logger.info("Starting FTP download thread")
-        ftp_manager = FTPDataManager()
-        
+        with ExitStack() as sessions:
+            self._sessions = sessions
+            # A session of our own is closed on exit; a caller-owned one stays open
+            ftp_manager = self.ftp_manager
+            if ftp_manager is None:
+                ftp_manager = sessions.enter_context(FTPDataManager())
+            ftp_manager.cache_dir = self.cache_dir
+            self._download(ftp_manager)
+            self.logger.debug("Closing this run's FTP sessions")
+        self._sessions = None
+        self.logger.info("FTP download thread completed")
+    
+    def _download(self, ftp_manager: FTPDataManager):
+        """List and download everything over ftp_manager, reporting the outcome via signals"""
         try:
             self.logger.debug("Emitting connection status update")
             self.status_updated.emit("Connecting to FTP server...")
             
             self.logger.info("Initiating FTP connection from thread")
             # Connect to FTP
-            success = ftp_manager.connect(self.host, self.username, self.password, self.directory)
+            success = ftp_manager.ensure_connected(self.host, self.username, self.password, self.directory)
             
             if not success:
                 error_msg = "Failed to connect to FTP server"
@@ -236,9 +678,11 @@ class FTPDownloadThread(QThread):
             self.logger.info("FTP connection successful, proceeding to file listing")
             self.status_updated.emit("Listing CSV files...")
             
-            # Get list of CSV files
-            csv_files = ftp_manager.list_csv_files()
-            self.logger.debug(f"Retrieved file list: {csv_files}")
+            # Get list of CSV files (with size/modify facts when the server has MLSD)
+            entries = ftp_manager.list_csv_entries()
+            csv_files = [name for name, _, _ in entries]
+            self._remote_stats = {name: (modify, size) for name, size, modify in entries}
+            self.logger.debug("Retrieved file list: %s", csv_files)
             
             if not csv_files:
                 error_msg = "No CSV files found on the server"
@@ -246,72 +690,41 @@ class FTPDownloadThread(QThread):
                 self.download_error.emit(error_msg)
                 return
             
-            self.logger.info(f"Found {len(csv_files)} CSV files to download")
+            self.logger.info("Found %d CSV files to download", len(csv_files))
             self.status_updated.emit(f"Found {len(csv_files)} files. Downloading...")
+            self.progress_updated.emit(0)
             
-            # Download all files
-            data_cache = {}
-            outdoor_data_cache = {}
-            available_dates = []
+            # Download all files, overlapping per-file latency across several sessions
+            workers = min(self.max_workers, len(csv_files))
+            self.logger.info("Downloading with up to %d concurrent FTP sessions", workers)
+            self._listing_manager = ftp_manager
+            self._listing_claimed = False
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self._fetch_one, csv_files, [len(csv_files)] * len(csv_files)))
+            self._listing_manager = None
             
-            for i, filename in enumerate(csv_files):
-                progress = int((i / len(csv_files)) * 100)
-                self.logger.debug(f"Download progress: {progress}% ({i+1}/{len(csv_files)})")
-                self.progress_updated.emit(progress)
-                self.status_updated.emit(f"Downloading {filename}...")
-                
-                self.logger.info(f"Downloading file {i+1}/{len(csv_files)}: {filename}")
-                content = ftp_manager.download_file(filename)
-                
-                if content:
-                    self.logger.debug(f"Successfully downloaded {filename}, processing date")
-                    
-                    # Check if it's an outdoor file
-                    is_outdoor = filename.endswith('_outside.csv')
-                    
-                    # Parse date from filename
-                    if is_outdoor:
-                        date_match = re.match(r'(\d{2})_(\d{2})_(\d{4})_outside\.csv', filename)
-                    else:
-                        date_match = re.match(r'(\d{2})_(\d{2})_(\d{4})\.csv', filename)
-                    
-                    if date_match:
-                        day, month, year = date_match.groups()
-                        date_str = f"{day}/{month}/{year}"
-                        
-                        if is_outdoor:
-                            outdoor_data_cache[date_str] = content
-                            self.logger.debug(f"Outdoor file {filename} mapped to date: {date_str}")
-                            self.logger.debug(f"Outdoor content preview: {content[:150]}")
-                        else:
-                            data_cache[date_str] = content
-                            self.logger.debug(f"Indoor file {filename} mapped to date: {date_str}")
-                        
-                        # Add to available dates if not already present
-                        if date_str not in available_dates:
-                            available_dates.append(date_str)
-                    else:
-                        self.logger.warning(f"File {filename} does not match expected date pattern")
-                else:
-                    self.logger.error(f"Failed to download content for {filename}")
+            # Files whose worker had no session go over the listing connection
+            results = [(filename, content if had_session else
+                        self._fetch_serial(ftp_manager, filename))
+                       for filename, content, had_session in results]
             
-            self.logger.info("Disconnecting from FTP server")
-            # Disconnect from FTP
-            ftp_manager.disconnect()
+            data_cache, outdoor_data_cache, available_dates = self._index_downloads(results)
             
-            self.logger.debug(f"Sorting {len(available_dates)} dates")
+            self.logger.debug("Sorting %d dates", len(available_dates))
             # Sort dates
-            available_dates.sort(key=lambda x: datetime.strptime(x, "%d/%m/%Y"))
-            self.logger.debug(f"Sorted dates: {available_dates}")
+            # dd/mm/yyyy is fixed-width and zero-padded, so (year, month, day) slices sort chronologically
+            available_dates = sorted(available_dates, key=lambda s: (s[6:10], s[3:5], s[0:2]))
+            self.logger.debug("Sorted dates: %s", available_dates)
             
             # Summary logging
             indoor_count = len(data_cache)
             outdoor_count = len(outdoor_data_cache)
-            self.logger.info(f"Download summary: {indoor_count} indoor files, {outdoor_count} outdoor files")
-            self.logger.debug(f"Indoor dates: {list(data_cache.keys())}")
-            self.logger.debug(f"Outdoor dates: {list(outdoor_data_cache.keys())}")
+            self.logger.info("Download summary: %d indoor files, %d outdoor files", indoor_count, outdoor_count)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Indoor dates: %s", list(data_cache))
+                self.logger.debug("Outdoor dates: %s", list(outdoor_data_cache))
             
-            self.logger.info(f"Download process completed successfully: {len(available_dates)} unique dates")
+            self.logger.info("Download process completed successfully: %d unique dates", len(available_dates))
             self.progress_updated.emit(100)
             self.status_updated.emit(f"Successfully downloaded {indoor_count + outdoor_count} files ({indoor_count} indoor, {outdoor_count} outdoor)")
             self.download_complete.emit(data_cache, outdoor_data_cache, available_dates)
@@ -319,9 +732,5 @@ class FTPDownloadThread(QThread):
         except Exception as e:
             error_msg = f"Error during download: {str(e)}"
             self.logger.error(error_msg)
-            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
+            self.logger.debug("Full traceback: %s", traceback.format_exc())
             self.download_error.emit(error_msg)
-        finally:
-            self.logger.debug("Ensuring FTP connection is closed in finally block")
-            ftp_manager.disconnect()
-            self.logger.info("FTP download thread completed")
@@ -5,16 +5,141 @@ Custom matplotlib canvas for environmental data visualization
 """
 
 import logging
+import math
 import traceback
+from typing import Optional
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+import matplotlib.dates as mdates
 from matplotlib.ticker import ScalarFormatter
+import numpy as np
 import pandas as pd
+from PyQt5.QtCore import QTimer
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# ---------------- Smoothing Helpers ----------------
+def centered_rolling(values: np.ndarray, window: int, method: str = "median") -> np.ndarray:
+    """Centered rolling median/mean with min_periods=1, matching pandas' center=True.
+
+    values may be 2-D, in which case every column is smoothed in the same call.
+    """
+    if bn is None or window > len(values):
+        frame = pd.DataFrame(values) if values.ndim == 2 else pd.Series(values)
+        rolling = frame.rolling(window, min_periods=1, center=True)
+        result = rolling.median() if method == "median" else rolling.mean()
+        return result.to_numpy(dtype=values.dtype)
+    
+    # bottleneck windows trail, so pad the tail and shift left by the centering offset
+    shift = (window - 1) // 2
+    padded = np.concatenate([values, np.full((shift,) + values.shape[1:], np.nan, dtype=values.dtype)])
+    move = bn.move_median if method == "median" else bn.move_mean
+    return move(padded, window=window, min_count=1, axis=0)[shift:]
+
+
+# ---------------- Heat Index ----------------
+if njit is not None:
+    # No fastmath: it would let LLVM assume away the NaN humidity check. Serial,
+    # since numba's parallel pool kept the process alive at exit when started from a Qt worker
+    @njit(cache=True)
+    def _heat_index_batch(temp_c, humidity, out):
+        """Fused per-sample heat index into out; same rules as calculate_heat_index"""
+        for i in range(len(temp_c)):
+            R = humidity[i]
+            T = temp_c[i] * 9.0 / 5.0 + 32.0
+            if math.isnan(R) or T < 80.0:
+                out[i] = temp_c[i]
+            else:
+                HI = (-42.379 + 2.04901523*T + 10.14333127*R - 0.22475541*T*R
+                      - 6.83783e-3*T*T - 5.481717e-2*R*R + 1.22874e-3*T*T*R
+                      + 8.5282e-4*T*R*R - 1.99e-6*T*T*R*R)
+                if R < 13 and 80 <= T <= 112:
+                    HI -= ((13-R)/4) * math.sqrt((17-math.fabs(T-95))/17)
+                elif R > 85 and 80 <= T <= 87:
+                    HI += ((R-85)/10) * ((87-T)/5)
+                out[i] = (HI - 32) * 5.0 / 9.0
+else:
+    _heat_index_batch = None
+
+
+# ---------------- Downsampling Helpers ----------------
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets selection of n_out points from (x, y)"""
+    n = len(x)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket (the last point for the final one) anchors the triangle
+        nhi = edges[i + 2] if i + 2 < len(edges) else n
+        nx, ny = x[hi:nhi].mean(), y[hi:nhi].mean()
+        area = np.abs((x[a] - nx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (ny - y[a]))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int, minmax_ratio: int = 4) -> np.ndarray:
+    """Indices of the points MinMaxLTTB keeps when reducing (x, y) to n_out points.
+
+    Min/max preselection per index bucket keeps every local extreme, then LTTB
+    picks the visually significant n_out points among those candidates.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    # Min/max preselection over the interior points
+    n_bins = max((n_out * minmax_ratio) // 2, 1)
+    bin_size = -(-(n - 2) // n_bins)
+    n_bins = -(-(n - 2) // bin_size)
+    interior = np.full(n_bins * bin_size, np.nan, dtype=np.float64)
+    interior[:n - 2] = y[1:n - 1]
+    interior = interior.reshape(n_bins, bin_size)
+    offsets = np.arange(n_bins) * bin_size + 1
+    mins = offsets + np.argmin(np.where(np.isnan(interior), np.inf, interior), axis=1)
+    maxs = offsets + np.argmax(np.where(np.isnan(interior), -np.inf, interior), axis=1)
+    candidates = np.unique(np.concatenate(([0], mins, maxs, [n - 1])))
+    candidates = candidates[candidates < n]
+    # Missing samples are never drawn, so LTTB only ranks real values
+    candidates = candidates[~np.isnan(y[candidates])]
+    if len(candidates) <= n_out:
+        return candidates
+
+    chosen = _lttb_indices(x[candidates].astype(np.float64), y[candidates].astype(np.float64), n_out)
+    return candidates[chosen]
+# ------------------------------------------------------
 
 
 class MatplotlibCanvas(FigureCanvas):
     """Custom matplotlib canvas for PyQt5 with smoothing + hover support"""
     
+    # Mouse moves are handled at most once per interval (~25 fps)
+    HOVER_INTERVAL_MS = 40
+    # Hover tooltip per plotted series: (column, label, unit, column shown as "Actual")
+    HOVER_FIELDS = {
+        'temp': ('temperature', 'Indoor Temp', '°C', None),
+        'humidity': ('humidity', 'Humidity', '%RH', None),
+        'pressure': ('pressure', 'Indoor Pressure', 'hPa', None),
+        'feels_like': ('feels_like', 'Feels Like', '°C', 'temperature'),
+    }
+    # Text sizes for the 2x2 grid and for a single maximised plot
+    AXES_STYLE = {
+        'all': {'title': {'fontsize': 10}, 'label': {'fontsize': 9}, 'ticks': 8},
+        'single': {'title': {'fontsize': 14, 'fontweight': 'bold'}, 'label': {'fontsize': 12}, 'ticks': 10},
+    }
+    
     def __init__(self, parent=None):
         self.logger = logging.getLogger('MatplotlibCanvas')
         self.logger.debug("Initializing matplotlib canvas")
@@ -26,20 +151,43 @@ class MatplotlibCanvas(FigureCanvas):
         self.logger.debug("Creating 2x2 subplot layout")
         self.axes = None  # Will be created based on view mode
         self.view_mode = 'all'  # Default view mode
+        self.hover_annotation = None
+        self._background = None  # Figure pixels without the hover annotation, for blitting
+        self._lines = {}  # (axes, label) -> Line2D, updated with set_data on the next plot
+        self._stale_lines = {}
+        self._reused_axes = set()  # Axes kept from the previous plot, which are already styled
         self._create_subplots()
         
         self.current_df = None
         self.current_outdoor_df = None
-        self.hover_annotation = None
+        self._hover_x = None  # current_df times as matplotlib date numbers (sorted), for hover lookups
+        self._hover_times = None  # current_df['datetime'] as an ndarray, for the hover label
+        self._hover_values = {}  # current_df column -> ndarray read by hover
+        self._hover_nan = {}  # current_df column -> precomputed missing-value mask
+        self._hover_map = {}  # Axes -> HOVER_FIELDS key of the series it shows
+        # Plain hPa tick labels; reused since only one pressure axes exists at a time
+        self._pressure_formatter = ScalarFormatter(useOffset=False)
+        self._pressure_formatter.set_scientific(False)
+        self._plot_cache = {}  # Prepared plot data keyed by (cache_key, n_out, smoothing)
         
-        # Connect hover event
-        self.mpl_connect('motion_notify_event', self.on_hover)
+        # Hover is connected only while data is plotted; only the latest move
+        # within HOVER_INTERVAL_MS is processed
+        self._hover_cid = None
+        self._pending_hover = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(self.HOVER_INTERVAL_MS)
+        self._hover_timer.timeout.connect(self._process_hover)
+        self.mpl_connect('draw_event', self._on_draw)
+        self.mpl_connect('resize_event', self._on_resize)
         
         self.clear_plots()
         self.logger.info("Matplotlib canvas initialized successfully")
     
     def _create_subplots(self):
         """Create subplots based on view mode"""
+        self._remove_hover_annotation()
+        self._lines = {}
         self.figure.clear()
         if self.view_mode == 'all':
             self.axes = self.figure.subplots(2, 2)
@@ -51,8 +199,12 @@ class MatplotlibCanvas(FigureCanvas):
     
     def set_view_mode(self, mode: str):
         """Set the view mode and recreate subplots"""
+        if mode == self.view_mode and self.axes is not None:
+            # Same layout; the next plot clears and reuses the existing axes
+            return
         self.logger.info(f"Setting view mode to: {mode}")
         self.view_mode = mode
+        self._disable_hover()
         self._create_subplots()
     
     def clear_plots(self):
@@ -60,6 +212,14 @@ class MatplotlibCanvas(FigureCanvas):
         self.logger.debug("Clearing all plots")
         self.current_df = None
         self.current_outdoor_df = None
+        self._hover_x = None
+        self._hover_times = None
+        self._hover_values = {}
+        self._hover_nan = {}
+        self._hover_map = {}
+        self._lines = {}
+        self._disable_hover()
+        self._remove_hover_annotation()
         try:
             if self.axes is None:
                 self._create_subplots()
@@ -67,149 +227,173 @@ class MatplotlibCanvas(FigureCanvas):
             if self.view_mode == 'all':
                 for i, ax in enumerate(self.axes.flat):
                     ax.clear()
-                    self.logger.debug(f"Cleared subplot {i}")
+                    self.logger.debug("Cleared subplot %d", i)
                 
                 self.axes[0, 0].set_title("No Data Available")
                 self.axes[0, 0].text(0.5, 0.5, "Connect to FTP and select date range\nto view environmental data", 
                                     ha='center', va='center', transform=self.axes[0, 0].transAxes, fontsize=12)
                 
+                # Blank rather than hide the others; visibility changes invalidate the layout
                 for i, ax in enumerate(self.axes.flat):
                     if i > 0:
-                        ax.set_visible(False)
-                        self.logger.debug(f"Hid subplot {i}")
+                        ax.set_axis_off()
+                        self.logger.debug("Blanked subplot %d", i)
             else:
                 self.axes.clear()
                 self.axes.set_title("No Data Available")
                 self.axes.text(0.5, 0.5, "Connect to FTP and select date range\nto view environmental data", 
                               ha='center', va='center', transform=self.axes.transAxes, fontsize=12)
             
-            self.draw()
+            self._schedule_redraw()
             self.logger.info("Plots cleared and canvas updated")
         except Exception as e:
             self.logger.error(f"Error clearing plots: {e}")
-            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Full traceback: %s", traceback.format_exc())
+
+    def _nearest_time_index(self, t: float) -> int:
+        """Position of the sample closest to date number t; binary search, since current_df is time-sorted"""
+        times = self._hover_x
+        i = int(np.searchsorted(times, t))
+        # Ties go to the earlier sample, as idxmin over the differences did
+        if i == len(times) or (i > 0 and t - times[i - 1] <= times[i] - t):
+            i = int(np.searchsorted(times, times[i - 1]))  # first of any repeated timestamps
+        return i
+
+    def _enable_hover(self):
+        """Start handling mouse moves once there is plotted data to look up"""
+        if self._hover_cid is None:
+            self._hover_cid = self.mpl_connect('motion_notify_event', self.on_hover)
+
+    def _disable_hover(self):
+        """Stop handling mouse moves, e.g. while the "No Data" placeholder is shown"""
+        if self._hover_cid is not None:
+            self.mpl_disconnect(self._hover_cid)
+            self._hover_cid = None
+        self._hover_timer.stop()
+        self._pending_hover = None
 
     def on_hover(self, event):
-        """Handle mouse hover events to show data point values"""
-        if event.inaxes is None or self.current_df is None or len(self.current_df) == 0:
-            if hasattr(self, 'hover_annotation') and self.hover_annotation:
-                self.hover_annotation.set_visible(False)
-                self.draw_idle()
+        """Queue a mouse move; the hover lookup and redraw run from _hover_timer"""
+        self._pending_hover = event
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
+
+    def _process_hover(self):
+        """Handle the most recent queued mouse move"""
+        event, self._pending_hover = self._pending_hover, None
+        if event is not None:
+            self._show_hover(event)
+            self._blit_hover()
+
+    def _on_draw(self, event):
+        """Snapshot each full redraw (which skips the animated hover annotation) for blitting"""
+        self._background = self.copy_from_bbox(self.figure.bbox)
+        if self.hover_annotation is not None and self.hover_annotation.get_visible():
+            self.figure.draw_artist(self.hover_annotation)
+
+    def _schedule_redraw(self):
+        """Coalesce full redraws into one on the next event-loop pass"""
+        self._background = None  # Stale until that draw takes a new snapshot
+        self.draw_idle()
+
+    def _on_resize(self, event):
+        """The snapshot no longer matches the canvas size; the next draw takes a new one"""
+        self._background = None
+
+    def _blit_hover(self):
+        """Paint the hover annotation over the cached background instead of redrawing every axes"""
+        if self._background is None:
+            self.draw_idle()
             return
+        self.restore_region(self._background)
+        if self.hover_annotation is not None and self.hover_annotation.get_visible():
+            self.figure.draw_artist(self.hover_annotation)
+        # The annotation can extend past its axes, so refresh the whole (already rendered) figure
+        self.blit(self.figure.bbox)
+
+    def _remove_hover_annotation(self):
+        """Drop the hover annotation, e.g. before its axes are cleared or replaced"""
+        if self.hover_annotation is not None:
+            try:
+                self.hover_annotation.remove()
+            except (ValueError, NotImplementedError):
+                pass  # Already removed along with its axes
+            self.hover_annotation = None
 
-        if hasattr(self, 'hover_annotation') and self.hover_annotation:
+    def _show_hover(self, event):
+        """Update the hover annotation for a mouse event; _blit_hover puts it on screen"""
+        if self.hover_annotation is not None:
             self.hover_annotation.set_visible(False)
 
+        if event.inaxes is None or self.current_df is None or len(self.current_df) == 0:
+            return
+
         ax = event.inaxes
         x_pos = event.xdata
         y_pos = event.ydata
 
         if x_pos is None or y_pos is None:
-            self.draw_idle()
             return
 
         try:
-            from matplotlib.dates import num2date
-            hover_time = num2date(x_pos)
-            if hover_time.tzinfo is not None:
-                hover_time = hover_time.replace(tzinfo=None)
-
-            time_diffs = abs(self.current_df['datetime'] - hover_time)
-            closest_idx = time_diffs.idxmin()
-            closest_point = self.current_df.iloc[closest_idx]
+            # xdata is already a date number, the same units as _hover_x
+            closest_idx = self._nearest_time_index(x_pos)
+            x_numeric = self._hover_x[closest_idx]
 
-            time_tolerance = pd.Timedelta(hours=2)
-            if time_diffs.iloc[closest_idx] > time_tolerance:
+            time_tolerance = 2 / 24  # 2 hours, in days
+            if abs(x_numeric - x_pos) > time_tolerance:
                 return
 
-            annotation_text = ""
-            display_x = closest_point['datetime']
-            display_y = 0
+            # Which series this axes shows was recorded when it was plotted
+            field = self._hover_map.get(ax)
+            if field is None:
+                return
+            col, label, unit, actual_col = self.HOVER_FIELDS[field]
+            display_x = pd.Timestamp(self._hover_times[closest_idx])
+            display_y = self._hover_values[col][closest_idx]
+            value = "N/A" if self._hover_nan[col][closest_idx] else f"{display_y:.1f}{unit}"
+            annotation_text = f"Time: {display_x:%d/%m/%Y %H:%M}\n{label}: {value}"
+            if actual_col is not None:
+                annotation_text += f"\nActual: {self._hover_values[actual_col][closest_idx]:.1f}{unit}"
 
-            # Determine what data to show based on view mode and axes
-            if self.view_mode == 'all':
-                if ax == self.axes[0, 0]:
-                    display_y = closest_point['temperature']
-                    annotation_text = f"Time: {display_x:%d/%m/%Y %H:%M}\nIndoor Temp: {display_y:.1f}°C"
-                elif ax == self.axes[0, 1]:
-                    display_y = closest_point['humidity']
-                    if pd.isna(display_y):
-                        annotation_text = f"Time: {display_x:%d/%m/%Y %H:%M}\nHumidity: N/A"
-                    else:
-                        annotation_text = f"Time: {display_x:%d/%m/%Y %H:%M}\nHumidity: {display_y:.1f}%RH"
-                elif ax == self.axes[1, 0]:
-                    display_y = closest_point['pressure']
-                    annotation_text = f"Time: {display_x:%d/%m/%Y %H:%M}\nIndoor Pressure: {display_y:.1f}hPa"
-                elif ax == self.axes[1, 1]:
-                    if 'feels_like' in closest_point:
-                        display_y = closest_point['feels_like']
-                        actual_temp = closest_point['temperature']
-                        annotation_text = (f"Time: {display_x:%d/%m/%Y %H:%M}\n"
-                                           f"Feels Like: {display_y:.1f}°C\nActual: {actual_temp:.1f}°C")
-                    else:
-                        display_y = closest_point['temperature']
-                        annotation_text = f"Time: {display_x:%d/%m/%Y %H:%M}\nTemp: {display_y:.1f}°C"
+            # Smart tooltip positioning to avoid boundary issues
+            # Relative position (0-1) of the point within the axes, via the axes' data-limits transform
+            x_rel, y_rel = ax.transLimits.transform((x_numeric, display_y))
+            
+            # Adjust tooltip position based on cursor location
+            if x_rel > 0.7:  # Right side - shift tooltip left
+                xytext = (-120, 40)
             else:
-                # Single view mode
-                if self.view_mode == 'temp':
-                    display_y = closest_point['temperature']
-                    annotation_text = f"Time: {display_x:%d/%m/%Y %H:%M}\nIndoor Temp: {display_y:.1f}°C"
-                elif self.view_mode == 'humidity':
-                    display_y = closest_point['humidity']
-                    if pd.isna(display_y):
-                        annotation_text = f"Time: {display_x:%d/%m/%Y %H:%M}\nHumidity: N/A"
-                    else:
-                        annotation_text = f"Time: {display_x:%d/%m/%Y %H:%M}\nHumidity: {display_y:.1f}%RH"
-                elif self.view_mode == 'pressure':
-                    display_y = closest_point['pressure']
-                    annotation_text = f"Time: {display_x:%d/%m/%Y %H:%M}\nIndoor Pressure: {display_y:.1f}hPa"
-                elif self.view_mode == 'feels_like':
-                    if 'feels_like' in closest_point:
-                        display_y = closest_point['feels_like']
-                        actual_temp = closest_point['temperature']
-                        annotation_text = (f"Time: {display_x:%d/%m/%Y %H:%M}\n"
-                                           f"Feels Like: {display_y:.1f}°C\nActual: {actual_temp:.1f}°C")
-                    else:
-                        display_y = closest_point['temperature']
-                        annotation_text = f"Time: {display_x:%d/%m/%Y %H:%M}\nTemp: {display_y:.1f}°C"
-
-            if annotation_text:
-                # Smart tooltip positioning to avoid boundary issues
-                # Get axes bounds in data coordinates
-                xlim = ax.get_xlim()
-                ylim = ax.get_ylim()
-                
-                # Convert display_x to numeric for comparison
-                from matplotlib.dates import date2num
-                x_numeric = date2num(display_x)
-                
-                # Calculate relative position (0-1)
-                x_rel = (x_numeric - xlim[0]) / (xlim[1] - xlim[0])
-                y_rel = (display_y - ylim[0]) / (ylim[1] - ylim[0])
-                
-                # Adjust tooltip position based on cursor location
-                if x_rel > 0.7:  # Right side - shift tooltip left
-                    xytext = (-120, 40)
-                else:
-                    xytext = (20, 40)
-                
-                if y_rel > 0.7:  # Top side - shift tooltip down
-                    xytext = (xytext[0], -40)
-                
-                self.hover_annotation = ax.annotate(
-                    annotation_text,
-                    xy=(display_x, display_y),
-                    xytext=xytext,
-                    textcoords='offset points',
-                    bbox={'boxstyle': 'round,pad=0.5', 'fc': 'lightyellow', 'alpha': 0.9, 'edgecolor': 'gray'},
-                    arrowprops={'arrowstyle': '->', 'connectionstyle': 'arc3,rad=0', 'color': 'gray'},
-                    fontsize=9,
-                    zorder=1000
-                )
-            self.draw_idle()
+                xytext = (20, 40)
+            
+            if y_rel > 0.7:  # Top side - shift tooltip down
+                xytext = (xytext[0], -40)
+            
+            if self.hover_annotation is not None and self.hover_annotation.axes is ax:
+                # Same axes as the last hover: move the existing annotation rather than build a new one
+                self.hover_annotation.set_text(annotation_text)
+                self.hover_annotation.xy = (x_numeric, display_y)
+                self.hover_annotation.xyann = xytext
+                self.hover_annotation.set_visible(True)
+                return
+            
+            self._remove_hover_annotation()
+            # Animated: left out of full redraws and painted by _blit_hover
+            self.hover_annotation = ax.annotate(
+                annotation_text,
+                xy=(x_numeric, display_y),
+                xytext=xytext,
+                textcoords='offset points',
+                bbox={'boxstyle': 'round,pad=0.5', 'fc': 'lightyellow', 'alpha': 0.9, 'edgecolor': 'gray'},
+                arrowprops={'arrowstyle': '->', 'connectionstyle': 'arc3,rad=0', 'color': 'gray'},
+                fontsize=9,
+                zorder=1000,
+                animated=True
+            )
 
         except Exception as e:
-            self.logger.debug(f"Error in hover handler: {e}")
+            self.logger.debug("Error in hover handler: %s", e)
 
     def calculate_heat_index(self, temp_c: float, humidity: float) -> float:
         """Calculate heat index (feels like temperature) from temperature and humidity"""
@@ -232,28 +416,101 @@ class MatplotlibCanvas(FigureCanvas):
             self.logger.warning(f"Error calculating heat index: {e}")
             return temp_c
 
+    @staticmethod
+    def calculate_heat_index_vectorized(temp_c: np.ndarray, humidity: np.ndarray) -> np.ndarray:
+        """Array version of calculate_heat_index for whole temperature/humidity columns"""
+        if _heat_index_batch is not None:
+            out = np.empty(len(temp_c), dtype=np.result_type(temp_c, humidity))
+            _heat_index_batch(temp_c, humidity, out)
+            return out
+        
+        T, R = temp_c * 9/5 + 32, humidity
+        HI = (-42.379 + 2.04901523*T + 10.14333127*R - 0.22475541*T*R
+              - 6.83783e-3*T*T - 5.481717e-2*R*R + 1.22874e-3*T*T*R
+              + 8.5282e-4*T*R*R - 1.99e-6*T*T*R*R)
+        # Both corrections are evaluated everywhere and masked, so silence the
+        # invalid sqrt outside the 80-112°F band
+        with np.errstate(invalid='ignore'):
+            HI = np.where((R < 13) & (T >= 80) & (T <= 112),
+                          HI - ((13-R)/4) * np.sqrt((17-np.abs(T-95))/17), HI)
+        HI = np.where((R > 85) & (T >= 80) & (T <= 87), HI + ((R-85)/10) * ((87-T)/5), HI)
+        return np.where(np.isnan(R) | (T < 80.0), temp_c, (HI - 32) * 5/9)
+
     # ---------------- Smoothing Helpers ----------------
     def apply_smoothing(self, df: pd.DataFrame, window: int, method: str = "median") -> pd.DataFrame:
         """Apply smoothing to numeric columns using median or mean"""
         if window <= 1:
             return df
         
-        df_smoothed = df.copy()
-        for col in ["temperature", "humidity", "pressure"]:
-            if col in df_smoothed.columns:
-                if method.lower() == "median":
-                    df_smoothed[col] = df_smoothed[col].rolling(window, min_periods=1, center=True).median()
-                else:  # mean
-                    df_smoothed[col] = df_smoothed[col].rolling(window, min_periods=1, center=True).mean()
-        return df_smoothed
+        cols = [col for col in ("temperature", "humidity", "pressure") if col in df.columns]
+        if not cols:
+            return df
+        # One pass over a (rows, columns) block instead of one call per column
+        smoothed = centered_rolling(df[cols].to_numpy(dtype=np.float32), window, method.lower())
+        # assign() leaves df untouched without deep-copying the columns it keeps
+        return df.assign(**{col: smoothed[:, i] for i, col in enumerate(cols)})
+
+    def downsample_for_plot(self, df: pd.DataFrame, n_out: int):
+        """Reduce df to n_out points per plotted column with MinMaxLTTB.
+        
+        Returns (frame, rows): frame holds the rows kept for any column, and rows
+        maps each downsampled column to the positions in frame kept for it, so
+        each line draws its own n_out points rather than the union. Columns
+        missing from rows are drawn from every row of frame.
+        """
+        if df is None or len(df) <= n_out:
+            return df, {}
+        
+        x = df['datetime'].to_numpy().view('i8')
+        keep = {col: minmax_lttb_indices(x, df[col].to_numpy(), n_out)
+                for col in ("temperature", "humidity", "pressure", "feels_like")
+                if col in df.columns and not df[col].isna().all()}
+        if not keep:
+            return df, {}
+        union = np.unique(np.concatenate(list(keep.values())))
+        self.logger.debug("Downsampled %d rows to %d per series for plotting", len(df), n_out)
+        return df.iloc[union], {col: np.searchsorted(union, idx) for col, idx in keep.items()}
+
+    def clear_plot_cache(self):
+        """Drop prepared plot data, e.g. after new files were downloaded"""
+        self._plot_cache.clear()
     # ---------------------------------------------------
 
-    def create_time_series_plots(self, indoor_df: pd.DataFrame, outdoor_df: pd.DataFrame = None, 
-                                smoothing_window: int = 1, smoothing_method: str = "median"):
-        """Create time series plots with user-controlled smoothing"""
-        self.logger.info(f"Creating time series plots for {len(indoor_df)} indoor data points")
-        if outdoor_df is not None and not outdoor_df.empty:
-            self.logger.info(f"Also plotting {len(outdoor_df)} outdoor data points")
+    def plot_points_target(self) -> int:
+        """Number of points per series worth drawing at the current canvas width"""
+        # Roughly two points per horizontal pixel is all the canvas can show
+        return 2 * max(self.width(), 500)
+    
+    def needs_feels_like(self) -> bool:
+        """Whether the current view plots the feels-like series"""
+        return self.view_mode in ('all', 'feels_like')
+
+    def _add_feels_like(self, df: pd.DataFrame) -> pd.DataFrame:
+        """df with a feels_like column (a new frame; the caller's is left as is)"""
+        return df.assign(feels_like=self.calculate_heat_index_vectorized(
+            df['temperature'].to_numpy(), df['humidity'].to_numpy()))
+
+    def prepare_plot_data(self, indoor_df: pd.DataFrame, outdoor_df: pd.DataFrame = None,
+                          smoothing_window: int = 1, smoothing_method: str = "median",
+                          cache_key=None, n_out: int = 1000, feels_like: bool = True):
+        """Smooth, add feels-like and downsample the series to plot.
+        
+        Touches no widgets, so it can run on a worker thread. Returns
+        (indoor_df, outdoor_df, plot_indoor, plot_outdoor): the full-resolution
+        frames used for hover, and the downsampled (frame, rows) pairs that are
+        drawn (see downsample_for_plot).
+        cache_key identifies the data being plotted (e.g. the selected date range);
+        when given, the result is reused on later calls. feels_like=False skips the
+        heat index for views that don't show it.
+        """
+        key = (cache_key, n_out, smoothing_window, smoothing_method)
+        if cache_key is not None:
+            # Data prepared with feels-like serves views without it as well
+            for cached_key in (key + (True,), key + (feels_like,)):
+                if cached_key in self._plot_cache:
+                    self.logger.debug("Reusing prepared plot data for %s", cache_key)
+                    return self._plot_cache[cached_key]
+        key += (feels_like,)
         
         # Apply smoothing based on user selection
         if smoothing_window > 1:
@@ -262,156 +519,261 @@ class MatplotlibCanvas(FigureCanvas):
             if outdoor_df is not None and not outdoor_df.empty:
                 outdoor_df = self.apply_smoothing(outdoor_df, smoothing_window, smoothing_method)
         
-        # Store DataFrame for hover functionality
-        self.current_df = indoor_df.copy()
-        self.current_outdoor_df = outdoor_df
+        # Calculate feels like temperature
+        if feels_like:
+            indoor_df = self._add_feels_like(indoor_df)
+        
+        # Downsample after smoothing, which depends on the full-resolution series
+        prepared = (indoor_df, outdoor_df,
+                    self.downsample_for_plot(indoor_df, n_out),
+                    self.downsample_for_plot(outdoor_df, n_out))
+        if cache_key is not None:
+            if len(self._plot_cache) >= 8:
+                self._plot_cache.pop(next(iter(self._plot_cache)))
+            self._plot_cache[key] = prepared
+        return prepared
+    
+    def create_time_series_plots(self, indoor_df: pd.DataFrame, outdoor_df: pd.DataFrame = None, 
+                                smoothing_window: int = 1, smoothing_method: str = "median",
+                                cache_key=None):
+        """Create time series plots with user-controlled smoothing"""
+        self.logger.info(f"Creating time series plots for {len(indoor_df)} indoor data points")
+        if outdoor_df is not None and not outdoor_df.empty:
+            self.logger.info(f"Also plotting {len(outdoor_df)} outdoor data points")
         
         try:
-            # Calculate feels like temperature
-            feels_like_temp = []
-            for _, row in indoor_df.iterrows():
-                feels_like = self.calculate_heat_index(row['temperature'], row['humidity'])
-                feels_like_temp.append(feels_like)
-            self.current_df['feels_like'] = feels_like_temp
+            prepared = self.prepare_plot_data(indoor_df, outdoor_df, smoothing_window, smoothing_method,
+                                              cache_key, self.plot_points_target(), self.needs_feels_like())
+        except Exception as e:
+            self.logger.error(f"Error creating time series plots: {e}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Full traceback: %s", traceback.format_exc())
+            raise
+        self.draw_prepared_plots(prepared)
+    
+    def draw_prepared_plots(self, prepared):
+        """Draw the output of prepare_plot_data; must run on the GUI thread"""
+        indoor_df, outdoor_df, (plot_indoor_df, indoor_rows), (plot_outdoor_df, outdoor_rows) = prepared
+        if self.needs_feels_like() and 'feels_like' not in indoor_df.columns:
+            # The view changed to one with feels-like while the data was being prepared
+            indoor_df = self._add_feels_like(indoor_df)
+            plot_indoor_df = self._add_feels_like(plot_indoor_df)
+        try:
+            # Store full-resolution DataFrame for hover functionality
+            self.current_df = indoor_df
+            self.current_outdoor_df = outdoor_df
+            self._hover_x = self._time_axis_values(indoor_df)
+            self._hover_times = indoor_df['datetime'].to_numpy()
+            self._hover_values = {col: indoor_df[col].to_numpy(dtype=np.float64)
+                                  for col in ('temperature', 'humidity', 'pressure', 'feels_like')
+                                  if col in indoor_df.columns}
+            self._hover_nan = {col: np.isnan(values) for col, values in self._hover_values.items()}
+            self._remove_hover_annotation()
             
             if self.view_mode == 'all':
-                self._plot_all_views(indoor_df, outdoor_df, feels_like_temp)
+                self._plot_all_views(plot_indoor_df, plot_outdoor_df, indoor_rows, outdoor_rows)
             else:
-                self._plot_single_view(indoor_df, outdoor_df, feels_like_temp)
+                self._plot_single_view(plot_indoor_df, plot_outdoor_df, indoor_rows, outdoor_rows)
             
             self.figure.tight_layout(pad=0.5 if self.view_mode != 'all' else 1.5)
-            self.draw()
+            self._schedule_redraw()
+            self._enable_hover()
             self.logger.info("Time series plots created and displayed successfully")
         except Exception as e:
             self.logger.error(f"Error creating time series plots: {e}")
-            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Full traceback: %s", traceback.format_exc())
             raise
     
-    def _plot_all_views(self, indoor_df: pd.DataFrame, outdoor_df: pd.DataFrame, feels_like_temp: list):
+    @staticmethod
+    def _time_axis_values(df: pd.DataFrame):
+        """Matplotlib date numbers for df's datetime column (None if df is empty)"""
+        if df is None or df.empty:
+            return None
+        return mdates.date2num(df['datetime'].to_numpy())
+
+    @staticmethod
+    def _series(x: np.ndarray, df: pd.DataFrame, column: str, rows: dict):
+        """(x, values) of df[column], limited to the rows downsampling kept for column"""
+        y = df[column].to_numpy()
+        positions = rows.get(column)
+        if positions is None:
+            return x, y
+        return x[positions], y[positions]
+
+    @staticmethod
+    def _format_time_axis(ax):
+        """Mark ax as a date axis for x values plotted as matplotlib date numbers"""
+        ax.xaxis_date()
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(ax.xaxis.get_major_locator()))
+
+    def _use_pressure_formatter(self, ax):
+        """Install the shared pressure formatter unless a reused axes still has it"""
+        if ax.yaxis.get_major_formatter() is not self._pressure_formatter:
+            ax.yaxis.set_major_formatter(self._pressure_formatter)
+
+    def _start_plot(self, axes):
+        """Begin a plot pass: keep axes whose lines can be updated, clear the others"""
+        self._stale_lines, self._lines = self._lines, {}
+        self._reused_axes = {ax for ax, _ in self._stale_lines}
+        for ax in axes:
+            if ax not in self._reused_axes:
+                ax.clear()
+            ax.set_axis_on()
+
+    def _style_axes(self, ax, title: str, ylabel: str, xlabel: Optional[str] = None):
+        """Title, labels, grid and tick styling for ax; skipped for reused axes, which keep theirs"""
+        if ax in self._reused_axes:
+            return
+        style = self.AXES_STYLE['all' if self.view_mode == 'all' else 'single']
+        ax.set_title(title, **style['title'])
+        ax.set_ylabel(ylabel, **style['label'])
+        if xlabel is not None:
+            ax.set_xlabel(xlabel, **style['label'])
+        ax.grid(True, alpha=0.3)
+        ax.tick_params(axis='x', rotation=45)
+        ax.tick_params(labelsize=style['ticks'])
+        self._format_time_axis(ax)
+
+    def _plot_line(self, ax, x, y, fmt: str, **kwargs):
+        """ax.plot, or set_data on the line with the same label from the previous plot"""
+        key = (ax, kwargs['label'])
+        line = self._stale_lines.pop(key, None)
+        y = np.asarray(y)  # No-op for the arrays callers pass; set_data keeps whatever it is given
+        if line is None:
+            line, = ax.plot(x, y, fmt, **kwargs)
+        else:
+            line.set_data(x, y)
+        self._lines[key] = line
+
+    def _finish_plot(self, axes, legend_fontsize: int):
+        """Remove lines that were not plotted again, rescale to the new data and add legends"""
+        for line in self._stale_lines.values():
+            line.remove()
+        self._stale_lines = {}
+        for ax in axes:
+            ax.relim()
+            ax.set_autoscale_on(True)  # Undo the previous plot's set_ylim
+            ax.autoscale_view()
+            ax.legend(fontsize=legend_fontsize)
+
+    @staticmethod
+    def _pressure_limits(indoor_df: pd.DataFrame, outdoor_df: pd.DataFrame):
+        """Padded (low, high) y-limits covering the plotted pressure lines, or None if all missing"""
+        pressure = indoor_df['pressure'].to_numpy(dtype=np.float64)
+        if outdoor_df is not None and not outdoor_df.empty:
+            # Outdoor pressure is drawn with its -1 hPa calibration applied
+            pressure = np.concatenate([pressure, outdoor_df['pressure'].to_numpy(dtype=np.float64) - 1])
+        if np.isnan(pressure).all():
+            return None
+        min_pressure = float(np.nanmin(pressure))
+        max_pressure = float(np.nanmax(pressure))
+        if not (math.isfinite(min_pressure) and math.isfinite(max_pressure)):
+            return None
+        padding = max((max_pressure - min_pressure) * 0.05, 1)  # 5% padding or minimum 1 hPa
+        return min_pressure - padding, max_pressure + padding
+
+    def _plot_all_views(self, indoor_df: pd.DataFrame, outdoor_df: pd.DataFrame, indoor_rows: dict, outdoor_rows: dict):
         """Plot all 4 graphs in 2x2 grid"""
         self.logger.debug("Clearing previous plots")
-        for ax in self.axes.flat:
-            ax.clear()
-            ax.set_visible(True)
+        self._start_plot(self.axes.flat)
+        self._hover_map = {self.axes[0, 0]: 'temp', self.axes[0, 1]: 'humidity',
+                           self.axes[1, 0]: 'pressure', self.axes[1, 1]: 'feels_like'}
+        
+        # Convert timestamps once and plot plain floats, bypassing per-call datetime conversion
+        indoor_x = self._time_axis_values(indoor_df)
+        outdoor_x = self._time_axis_values(outdoor_df)
+        # Bind each series as (x, y) arrays once so ax.plot never has to coerce Series
+        indoor_temp = self._series(indoor_x, indoor_df, 'temperature', indoor_rows)
+        indoor_hum = self._series(indoor_x, indoor_df, 'humidity', indoor_rows)
+        indoor_pres = self._series(indoor_x, indoor_df, 'pressure', indoor_rows)
+        feels_like = self._series(indoor_x, indoor_df, 'feels_like', indoor_rows)
+        has_outdoor = outdoor_df is not None and not outdoor_df.empty
+        if has_outdoor:
+            outdoor_temp = self._series(outdoor_x, outdoor_df, 'temperature', outdoor_rows)
+            outdoor_pres = self._series(outdoor_x, outdoor_df, 'pressure', outdoor_rows)
         
         # Plot 1: Temperature (Indoor and Outdoor)
         self.logger.debug("Creating temperature plot")
-        self.axes[0, 0].plot(indoor_df['datetime'], indoor_df['temperature'], 'r-', linewidth=1.5, label='Indoor Temperature')
-        if outdoor_df is not None and not outdoor_df.empty:
-            self.axes[0, 0].plot(outdoor_df['datetime'], outdoor_df['temperature'], 'orange', linewidth=1.5, label='Outdoor Temperature')
-        
-        self.axes[0, 0].set_title('Temperature Over Time', fontsize=10)
-        self.axes[0, 0].set_ylabel('Temperature (°C)', fontsize=9)
-        self.axes[0, 0].grid(True, alpha=0.3)
-        self.axes[0, 0].tick_params(axis='x', rotation=45, labelsize=8)
-        self.axes[0, 0].tick_params(axis='y', labelsize=8)
-        self.axes[0, 0].legend(fontsize=8)
+        self._plot_line(self.axes[0, 0], *indoor_temp, 'r-', linewidth=1.5, label='Indoor Temperature')
+        if has_outdoor:
+            self._plot_line(self.axes[0, 0], *outdoor_temp, 'orange', linewidth=1.5, label='Outdoor Temperature')
+        self._style_axes(self.axes[0, 0], 'Temperature Over Time', 'Temperature (°C)')
         
         # Plot 2: Humidity (Indoor only)
         self.logger.debug("Creating humidity plot")
-        self.axes[0, 1].plot(indoor_df['datetime'], indoor_df['humidity'], 'b-', linewidth=1.5, label='Indoor Humidity')
-        self.axes[0, 1].set_title('Humidity Over Time (Indoor Only)', fontsize=10)
-        self.axes[0, 1].set_ylabel('Humidity (%RH)', fontsize=9)
-        self.axes[0, 1].grid(True, alpha=0.3)
-        self.axes[0, 1].tick_params(axis='x', rotation=45, labelsize=8)
-        self.axes[0, 1].tick_params(axis='y', labelsize=8)
-        self.axes[0, 1].legend(fontsize=8)
+        self._plot_line(self.axes[0, 1], *indoor_hum, 'b-', linewidth=1.5, label='Indoor Humidity')
+        self._style_axes(self.axes[0, 1], 'Humidity Over Time (Indoor Only)', 'Humidity (%RH)')
         
         # Plot 3: Pressure (Indoor and Outdoor)
         self.logger.debug("Creating pressure plot")
-        self.axes[1, 0].plot(indoor_df['datetime'], indoor_df['pressure'], 'g-', linewidth=1.5, label='Indoor Pressure')
-        if outdoor_df is not None and not outdoor_df.empty:
+        self._plot_line(self.axes[1, 0], *indoor_pres, 'g-', linewidth=1.5, label='Indoor Pressure')
+        if has_outdoor:
             # Subtract 1 from outdoor pressure values for calibration
-            self.axes[1, 0].plot(outdoor_df['datetime'], outdoor_df['pressure'] - 1, 'purple', linewidth=1.5, label='Outdoor Pressure')
-        
-        self.axes[1, 0].set_title('Atmospheric Pressure Over Time', fontsize=10)
-        self.axes[1, 0].set_ylabel('Pressure (hPa)', fontsize=9)
-        self.axes[1, 0].grid(True, alpha=0.3)
-        self.axes[1, 0].tick_params(axis='x', rotation=45, labelsize=8)
-        self.axes[1, 0].tick_params(axis='y', labelsize=8)
-        self.axes[1, 0].legend(fontsize=8)
+            self._plot_line(self.axes[1, 0], outdoor_pres[0], outdoor_pres[1] - 1, 'purple', linewidth=1.5, label='Outdoor Pressure')
+        self._style_axes(self.axes[1, 0], 'Atmospheric Pressure Over Time', 'Pressure (hPa)')
         
         # Fix Y-axis formatting to prevent scientific notation
-        pressure_formatter = ScalarFormatter(useOffset=False)
-        pressure_formatter.set_scientific(False)
-        self.axes[1, 0].yaxis.set_major_formatter(pressure_formatter)
-        
-        # Set Y-axis limits to show proper pressure range
-        all_pressure_values = indoor_df['pressure'].dropna().tolist()
-        if outdoor_df is not None and not outdoor_df.empty:
-            all_pressure_values.extend(outdoor_df['pressure'].dropna().tolist())
-        if all_pressure_values:
-            min_pressure = min(all_pressure_values)
-            max_pressure = max(all_pressure_values)
-            pressure_range = max_pressure - min_pressure
-            padding = max(pressure_range * 0.05, 1)  # 5% padding or minimum 1 hPa
-            self.axes[1, 0].set_ylim(min_pressure - padding, max_pressure + padding)
+        self._use_pressure_formatter(self.axes[1, 0])
         
         # Plot 4: Feels Like Temperature (Heat Index)
         self.logger.debug("Creating feels like temperature plot")
-        indoor_df_copy = indoor_df.copy()
-        indoor_df_copy['feels_like'] = feels_like_temp
+        self._plot_line(self.axes[1, 1], *feels_like, 'darkred', linewidth=1.5, marker='o', markersize=1, label='Feels Like')
+        self._plot_line(self.axes[1, 1], *indoor_temp, 'lightcoral', linewidth=1, alpha=0.7, label='Actual Temp')
+        self._style_axes(self.axes[1, 1], 'Feels Like Temperature Over Time', 'Temperature (°C)', 'Date/Time')
+        
+        self._finish_plot(self.axes.flat, legend_fontsize=8)
         
-        self.axes[1, 1].plot(indoor_df_copy['datetime'], indoor_df_copy['feels_like'], 'darkred', linewidth=1.5, marker='o', markersize=1, label='Feels Like')
-        self.axes[1, 1].plot(indoor_df_copy['datetime'], indoor_df_copy['temperature'], 'lightcoral', linewidth=1, alpha=0.7, label='Actual Temp')
-        self.axes[1, 1].set_title('Feels Like Temperature Over Time', fontsize=10)
-        self.axes[1, 1].set_ylabel('Temperature (°C)', fontsize=9)
-        self.axes[1, 1].set_xlabel('Date/Time', fontsize=9)
-        self.axes[1, 1].grid(True, alpha=0.3)
-        self.axes[1, 1].tick_params(axis='x', rotation=45, labelsize=8)
-        self.axes[1, 1].tick_params(axis='y', labelsize=8)
-        self.axes[1, 1].legend(fontsize=8)
+        # Set Y-axis limits to show proper pressure range
+        pressure_limits = self._pressure_limits(indoor_df, outdoor_df)
+        if pressure_limits is not None:
+            self.axes[1, 0].set_ylim(*pressure_limits)
     
-    def _plot_single_view(self, indoor_df: pd.DataFrame, outdoor_df: pd.DataFrame, feels_like_temp: list):
+    def _plot_single_view(self, indoor_df: pd.DataFrame, outdoor_df: pd.DataFrame, indoor_rows: dict, outdoor_rows: dict):
         """Plot a single graph in full view"""
-        self.logger.debug(f"Creating single view plot for: {self.view_mode}")
-        self.axes.clear()
+        self.logger.debug("Creating single view plot for: %s", self.view_mode)
+        self._start_plot([self.axes])
+        self._hover_map = {self.axes: self.view_mode}
+        
+        indoor_x = self._time_axis_values(indoor_df)
+        outdoor_x = self._time_axis_values(outdoor_df)
+        indoor_temp = self._series(indoor_x, indoor_df, 'temperature', indoor_rows)
+        indoor_hum = self._series(indoor_x, indoor_df, 'humidity', indoor_rows)
+        indoor_pres = self._series(indoor_x, indoor_df, 'pressure', indoor_rows)
+        has_outdoor = outdoor_df is not None and not outdoor_df.empty
+        if has_outdoor:
+            outdoor_temp = self._series(outdoor_x, outdoor_df, 'temperature', outdoor_rows)
+            outdoor_pres = self._series(outdoor_x, outdoor_df, 'pressure', outdoor_rows)
         
         if self.view_mode == 'temp':
-            self.axes.plot(indoor_df['datetime'], indoor_df['temperature'], 'r-', linewidth=2, label='Indoor Temperature')
-            if outdoor_df is not None and not outdoor_df.empty:
-                self.axes.plot(outdoor_df['datetime'], outdoor_df['temperature'], 'orange', linewidth=2, label='Outdoor Temperature')
-            self.axes.set_title('Temperature Over Time', fontsize=14, fontweight='bold')
-            self.axes.set_ylabel('Temperature (°C)', fontsize=12)
+            self._plot_line(self.axes, *indoor_temp, 'r-', linewidth=2, label='Indoor Temperature')
+            if has_outdoor:
+                self._plot_line(self.axes, *outdoor_temp, 'orange', linewidth=2, label='Outdoor Temperature')
+            self._style_axes(self.axes, 'Temperature Over Time', 'Temperature (°C)', 'Date/Time')
             
         elif self.view_mode == 'humidity':
-            self.axes.plot(indoor_df['datetime'], indoor_df['humidity'], 'b-', linewidth=2, label='Indoor Humidity')
-            self.axes.set_title('Humidity Over Time (Indoor Only)', fontsize=14, fontweight='bold')
-            self.axes.set_ylabel('Humidity (%RH)', fontsize=12)
+            self._plot_line(self.axes, *indoor_hum, 'b-', linewidth=2, label='Indoor Humidity')
+            self._style_axes(self.axes, 'Humidity Over Time (Indoor Only)', 'Humidity (%RH)', 'Date/Time')
             
         elif self.view_mode == 'pressure':
-            self.axes.plot(indoor_df['datetime'], indoor_df['pressure'], 'g-', linewidth=2, label='Indoor Pressure')
-            if outdoor_df is not None and not outdoor_df.empty:
-                self.axes.plot(outdoor_df['datetime'], outdoor_df['pressure'] - 1, 'purple', linewidth=2, label='Outdoor Pressure')
-            self.axes.set_title('Atmospheric Pressure Over Time', fontsize=14, fontweight='bold')
-            self.axes.set_ylabel('Pressure (hPa)', fontsize=12)
+            self._plot_line(self.axes, *indoor_pres, 'g-', linewidth=2, label='Indoor Pressure')
+            if has_outdoor:
+                self._plot_line(self.axes, outdoor_pres[0], outdoor_pres[1] - 1, 'purple', linewidth=2, label='Outdoor Pressure')
+            self._style_axes(self.axes, 'Atmospheric Pressure Over Time', 'Pressure (hPa)', 'Date/Time')
             
             # Fix Y-axis formatting
-            pressure_formatter = ScalarFormatter(useOffset=False)
-            pressure_formatter.set_scientific(False)
-            self.axes.yaxis.set_major_formatter(pressure_formatter)
-            
-            # Set Y-axis limits
-            all_pressure_values = indoor_df['pressure'].dropna().tolist()
-            if outdoor_df is not None and not outdoor_df.empty:
-                all_pressure_values.extend(outdoor_df['pressure'].dropna().tolist())
-            if all_pressure_values:
-                min_pressure = min(all_pressure_values)
-                max_pressure = max(all_pressure_values)
-                pressure_range = max_pressure - min_pressure
-                padding = max(pressure_range * 0.05, 1)
-                self.axes.set_ylim(min_pressure - padding, max_pressure + padding)
+            self._use_pressure_formatter(self.axes)
                 
         elif self.view_mode == 'feels_like':
-            indoor_df_copy = indoor_df.copy()
-            indoor_df_copy['feels_like'] = feels_like_temp
-            self.axes.plot(indoor_df_copy['datetime'], indoor_df_copy['feels_like'], 'darkred', linewidth=2, marker='o', markersize=2, label='Feels Like')
-            self.axes.plot(indoor_df_copy['datetime'], indoor_df_copy['temperature'], 'lightcoral', linewidth=1.5, alpha=0.7, label='Actual Temp')
-            self.axes.set_title('Feels Like Temperature Over Time', fontsize=14, fontweight='bold')
-            self.axes.set_ylabel('Temperature (°C)', fontsize=12)
+            feels_like = self._series(indoor_x, indoor_df, 'feels_like', indoor_rows)
+            self._plot_line(self.axes, *feels_like, 'darkred', linewidth=2, marker='o', markersize=2, label='Feels Like')
+            self._plot_line(self.axes, *indoor_temp, 'lightcoral', linewidth=1.5, alpha=0.7, label='Actual Temp')
+            self._style_axes(self.axes, 'Feels Like Temperature Over Time', 'Temperature (°C)', 'Date/Time')
+        
+        self._finish_plot([self.axes], legend_fontsize=10)
         
-        self.axes.set_xlabel('Date/Time', fontsize=12)
-        self.axes.grid(True, alpha=0.3)
-        self.axes.tick_params(axis='x', rotation=45, labelsize=10)
-        self.axes.tick_params(axis='y', labelsize=10)
-        self.axes.legend(fontsize=10)
+        if self.view_mode == 'pressure':
+            # Set Y-axis limits
+            pressure_limits = self._pressure_limits(indoor_df, outdoor_df)
+            if pressure_limits is not None:
+                self.axes.set_ylim(*pressure_limits)
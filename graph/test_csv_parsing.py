@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+CSV Parsing Tests
+Checks parse_csv_bytes against malformed sensor rows, with and without pyarrow
+"""
+
+import unittest
+import ftp_manager
+
+
+GOOD_ROWS = (b"01/06/2025 10:00,5,25.1,1005.2,50.0\n"
+             b"01/06/2025 10:05,5,25.2,1005.3,51.0\n")
+
+
+class ParseCsvBytesTest(unittest.TestCase):
+    """Rows with extra fields keep their first five, as the original line parser did"""
+
+    def parse(self, content: bytes):
+        """Parse with each available reader and check they agree"""
+        frames = [ftp_manager.parse_csv_bytes(content)]
+        if ftp_manager.pa is not None:
+            pa, ftp_manager.pa = ftp_manager.pa, None
+            try:
+                frames.append(ftp_manager.parse_csv_bytes(content))
+            finally:
+                ftp_manager.pa = pa
+        for df in frames[1:]:
+            self.assertTrue(df.equals(frames[0]))
+        return frames[0]
+
+    def check_typed(self, df):
+        self.assertEqual(list(df.columns), ftp_manager.CSV_COLUMNS)
+        self.assertEqual(str(df['datetime'].dtype), 'datetime64[ns]')
+        for col, dtype in ftp_manager.CSV_DTYPES.items():
+            self.assertEqual(str(df[col].dtype), dtype)
+
+    def test_six_field_first_row(self):
+        df = self.parse(b"01/06/2025 09:55,5,25.0,1005.1,49.0,99\n" + GOOD_ROWS)
+        self.check_typed(df)
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df['sample_size'].tolist(), [5, 5, 5])
+        self.assertAlmostEqual(float(df['humidity'].iat[0]), 49.0)
+
+    def test_six_field_row_mid_file(self):
+        df = self.parse(GOOD_ROWS + b"01/06/2025 10:10,5,25.0,1005.1,49.0,99\n")
+        self.check_typed(df)
+        self.assertEqual(len(df), 3)
+        self.assertAlmostEqual(float(df['pressure'].iat[2]), 1005.1, places=3)
+
+    def test_trailing_comma_rows(self):
+        df = self.parse(GOOD_ROWS.replace(b"\n", b",\n"))
+        self.check_typed(df)
+        self.assertEqual(len(df), 2)
+        self.assertAlmostEqual(float(df['temperature'].iat[1]), 25.2, places=5)
+
+    def test_four_field_outdoor_rows(self):
+        df = self.parse(b"01/06/2025 10:00,5,25.1,1005.2\n"
+                        b"01/06/2025 10:05,5,25.2,1005.3\n")
+        self.check_typed(df)
+        self.assertEqual(len(df), 2)
+        self.assertTrue(df['humidity'].isna().all())
+        self.assertAlmostEqual(float(df['pressure'].iat[1]), 1005.3, places=3)
+
+    def test_mixed_four_and_five_field_rows(self):
+        df = self.parse(b"01/06/2025 09:55,5,25.0,1005.1\n" + GOOD_ROWS
+                        + b"01/06/2025 10:10,5,25.3,1005.4,52.0,\n")
+        self.check_typed(df)
+        self.assertEqual(len(df), 4)
+        self.assertTrue(df['humidity'].isna().iat[0])
+        self.assertEqual(df['humidity'].iloc[1:].tolist(), [50.0, 51.0, 52.0])
+
+    def test_unconvertible_rows_are_dropped(self):
+        df = self.parse(GOOD_ROWS + b"01/06/2025 10:10,x,25.0,abc,49.0\nnot a row\n")
+        self.check_typed(df)
+        self.assertEqual(len(df), 2)
+
+    def test_out_of_range_sample_size_is_dropped(self):
+        df = self.parse(GOOD_ROWS + b"01/06/2025 10:10,40000,25.0,1005.1,49.0\n"
+                        b"01/06/2025 10:15,-40000,25.0,1005.1,49.0\n")
+        self.check_typed(df)
+        self.assertEqual(df['sample_size'].tolist(), [5, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()